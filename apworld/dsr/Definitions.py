@@ -0,0 +1,63 @@
+import functools
+import marshal
+import pkgutil
+import sys
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Stored in a column where a row has no value, e.g. the region of an item
+NO_VALUE = 0xFFFFFFFF
+
+# Bumped whenever the layout of _tables.bin changes, an older cache is ignored
+TABLE_CACHE_FORMAT = 1
+TABLE_CACHE_NAME = "_tables.bin"
+
+
+class DSRTableCache(NamedTuple):
+    # (name, dsr_code, category) per item
+    items: Tuple[Tuple[str, int, int], ...]
+    # (region name, ((id, name, default item, category), ...)) per location table, in table order
+    locations: Tuple[Tuple[str, Tuple[Tuple[int, str, str, int], ...]], ...]
+
+
+@functools.lru_cache(maxsize=None)
+def load_table_cache() -> Optional[DSRTableCache]:
+    # _tables.bin is written by tools/generate_ids.py from ItemTable.py and LocationTable.py. Loading it is a single
+    # unmarshal, so those two modules are never compiled at runtime. Without a usable cache they are imported instead.
+    try:
+        data = pkgutil.get_data(__package__, TABLE_CACHE_NAME)
+        cache_format, items, locations = marshal.loads(data)
+    except (OSError, ValueError, TypeError, EOFError):
+        return None
+    if cache_format != TABLE_CACHE_FORMAT:
+        return None
+    return DSRTableCache(items, locations)
+
+
+class DSRDefinitionStore:
+    # Columnar copy of an item or location table: one interned name tuple plus parallel array("I") columns, with
+    # O(1) id -> row and name -> row indexes. Shared by every slot, nothing in here is per world.
+    __slots__ = ("names", "ids", "dsr_codes", "categories", "regions", "row_by_id", "row_by_name")
+
+    def __init__(self, rows: Iterable[Tuple[str, int, int, int, Optional[int]]]):
+        names: List[str] = []
+        self.ids = array("I")
+        self.dsr_codes = array("I")
+        self.categories = array("I")
+        self.regions = array("I")
+        for name, archipelago_id, dsr_code, category, region in rows:
+            names.append(sys.intern(name))
+            self.ids.append(archipelago_id)
+            self.dsr_codes.append(dsr_code)
+            self.categories.append(category)
+            self.regions.append(NO_VALUE if region is None else region)
+        self.names: Tuple[str, ...] = tuple(names)
+        self.row_by_id: Dict[int, int] = {archipelago_id: row for row, archipelago_id in enumerate(self.ids)}
+        self.row_by_name: Dict[str, int] = {name: row for row, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def rows_in_categories(self, categories: Iterable[int]) -> List[int]:
+        wanted = set(categories)
+        return [row for row, category in enumerate(self.categories) if category in wanted]
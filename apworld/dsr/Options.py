@@ -12,8 +12,47 @@ class EnableMasterKeyOption(Toggle):
     """Includes the Master Key in the item pool"""
     display_name = "Enable Master Key"
 
+class EnableItemLotsOption(DefaultOnToggle):
+    """Includes item pickups and chests as randomized locations, otherwise they keep their vanilla items. Key items that no longer fit in the free locations are given at the start"""
+    display_name = "Enable Item Lots"
+
+class EnableDoorsOption(DefaultOnToggle):
+    """Includes opening doors and shortcuts as randomized locations"""
+    display_name = "Enable Doors"
+
+class EnableEnemyDropsOption(Toggle):
+    """Includes the guaranteed enemy drops the client can detect as randomized locations"""
+    display_name = "Enable Enemy Drops"
+
+class EnableSnugglyTradesOption(DefaultOnToggle):
+    """Includes Snuggly's trades as randomized locations, otherwise they keep their vanilla rewards"""
+    display_name = "Enable Snuggly Trades"
+
+class MaxRandomizedLocationsOption(Range):
+    """Caps the number of randomized locations, the rest keep their vanilla items. Progression and boss area locations are kept first. 0 means no cap. Values below the number of key items plus guaranteed items (60, 61 with the Master Key) are raised to it, values above the enabled locations (526 with every category on) have no effect"""
+    display_name = "Max Randomized Locations"
+    range_start = 0
+    range_end = 1000
+    default = 0
+    special_range_names = {"unlimited": 0}
+
+class StartWithFirelinkUnlockedOption(Toggle):
+    """Starts with the Undead Asylum keys and Firelink Shrine open, so the first sphere reaches past the Asylum"""
+    display_name = "Start With Firelink Unlocked"
+
+class CompactSlotDataOption(Toggle):
+    """Sends the location and item lists to the client as packed, delta-encoded arrays instead of plain lists"""
+    display_name = "Compact Slot Data"
+
 @dataclass
 class DSROption(PerGameCommonOptions):
     #goal: GoalOption
     guaranteed_items: GuaranteedItemsOption
-    enable_masterkey: EnableMasterKeyOption
\ No newline at end of file
+    enable_masterkey: EnableMasterKeyOption
+    enable_item_lots: EnableItemLotsOption
+    enable_doors: EnableDoorsOption
+    enable_enemy_drops: EnableEnemyDropsOption
+    enable_snuggly_trades: EnableSnugglyTradesOption
+    max_randomized_locations: MaxRandomizedLocationsOption
+    start_with_firelink_unlocked: StartWithFirelinkUnlockedOption
+    compact_slot_data: CompactSlotDataOption
@@ -0,0 +1,190 @@
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from BaseClasses import CollectionState
+
+from .Items import progression_mask, progression_mask_key
+
+
+class DSRRegionConnection(NamedTuple):
+    from_region: str
+    to_region: str
+    all_of: Tuple[str, ...] = ()
+    any_of: Tuple[str, ...] = ()
+
+
+# The region graph: every entrance and the items needed to use it (all of all_of, and at least one of any_of)
+region_connections: List[DSRRegionConnection] = [
+    DSRRegionConnection("Menu", "Undead Asylum Cell"),
+
+    DSRRegionConnection("Undead Asylum Cell", "Undead Asylum Cell Door", all_of=("Dungeon Cell Key",)),
+    DSRRegionConnection("Undead Asylum Cell Door", "Northern Undead Asylum"),
+    DSRRegionConnection("Northern Undead Asylum", "Northern Undead Asylum F2 East Door", all_of=("Undead Asylum F2 East Key",)),
+    DSRRegionConnection("Northern Undead Asylum F2 East Door", "Northern Undead Asylum - After F2 East Door"),
+    DSRRegionConnection("Northern Undead Asylum - After F2 East Door", "Undead Asylum Big Pilgrim Door", all_of=("Big Pilgrim's Key",)),
+    DSRRegionConnection("Undead Asylum Big Pilgrim Door", "Firelink Shrine"),
+
+    DSRRegionConnection("Firelink Shrine", "Upper Undead Burg"),
+    DSRRegionConnection("Firelink Shrine", "The Catacombs", all_of=("Ornstein and Smough Defeated",)),
+    DSRRegionConnection("Firelink Shrine", "Upper New Londo Ruins"),
+    DSRRegionConnection("Firelink Shrine - After Undead Parish Elevator", "Northern Undead Asylum - Second Visit Snuggly Trades"),
+    DSRRegionConnection("Firelink Shrine", "Kiln of the First Flame", all_of=("Lord Soul (Bed of Chaos)", "Lord Soul (Nito)", "Bequeathed Lord Soul Shard (Four Kings)", "Bequeathed Lord Soul Shard (Seath)", "Lordvessel")),
+
+    DSRRegionConnection("Northern Undead Asylum - Second Visit Snuggly Trades", "Northern Undead Asylum - Second Visit F2 West Door", all_of=("Undead Asylum F2 West Key",)),
+    DSRRegionConnection("Northern Undead Asylum - Second Visit F2 West Door", "Northern Undead Asylum - Second Visit Behind F2 West Door"),
+
+    DSRRegionConnection("Upper Undead Burg", "Undead Burg Basement Door", all_of=("Taurus Demon Defeated", "Basement Key")),
+    DSRRegionConnection("Upper Undead Burg", "Undead Parish", all_of=("Taurus Demon Defeated",)),
+    DSRRegionConnection("Upper Undead Burg", "Darkroot Basin"),
+    DSRRegionConnection("Upper Undead Burg", "Upper Undead Burg - Pine Resin Chest", any_of=("Master Key", "Residence Key")),
+
+    DSRRegionConnection("Upper Undead Burg", "Watchtower Basement", any_of=("Master Key", "Watchtower Basement Key")),
+    DSRRegionConnection("Darkroot Basin", "Watchtower Basement", any_of=("Master Key", "Watchtower Basement Key")),
+
+    DSRRegionConnection("Undead Parish", "Firelink Shrine - After Undead Parish Elevator"),
+    DSRRegionConnection("Undead Parish", "Darkroot Garden"),
+    DSRRegionConnection("Undead Parish", "Sen's Fortress", all_of=("Bell of Awakening #1", "Bell of Awakening #2")),
+
+    DSRRegionConnection("Darkroot Garden", "Darkroot Basin"),
+    DSRRegionConnection("Darkroot Garden", "Darkroot Garden - Behind Artorias Door", all_of=("Crest of Artorias",)),
+
+    DSRRegionConnection("Undead Burg Basement Door", "Lower Undead Burg"),
+    DSRRegionConnection("Lower Undead Burg", "Depths", all_of=("Key to Depths",)),
+    DSRRegionConnection("Lower Undead Burg", "Lower Undead Burg - After Residence Key", all_of=("Residence Key",)),
+
+    DSRRegionConnection("Upper New Londo Ruins", "New Londo Ruins Door to the Seal", all_of=("Ornstein and Smough Defeated", "Key to the Seal")),
+    DSRRegionConnection("New Londo Ruins Door to the Seal", "Lower New Londo Ruins"),
+
+    DSRRegionConnection("Upper New Londo Ruins", "Door between Upper New Londo and Valley of the Drakes", any_of=("Key to New Londo Ruins", "Master Key")),
+    DSRRegionConnection("Door between Upper New Londo and Valley of the Drakes", "Valley of the Drakes", any_of=("Key to New Londo Ruins", "Master Key")),
+
+    DSRRegionConnection("Lower New Londo Ruins", "Valley of the Drakes"),
+
+    DSRRegionConnection("Depths", "Depths - After Sewer Chamber Key", all_of=("Sewer Chamber Key",)),
+    DSRRegionConnection("Depths", "Depths to Blighttown Door", all_of=("Blighttown Key",)),
+
+    DSRRegionConnection("Valley of the Drakes", "Blighttown"),
+    DSRRegionConnection("Valley of the Drakes", "Darkroot Basin"),
+    DSRRegionConnection("Valley of the Drakes", "Valley of the Drakes - After Defeating Four Kings", all_of=("Four Kings Defeated",)),
+
+    DSRRegionConnection("Depths to Blighttown Door", "Blighttown"),
+    DSRRegionConnection("Blighttown", "Depths to Blighttown Door", all_of=("Depths -> Blighttown opened",)),
+    DSRRegionConnection("Blighttown", "Demon Ruins", all_of=("Chaos Witch Quelaag Defeated",)),
+    DSRRegionConnection("Blighttown", "The Great Hollow", all_of=("Lordvessel",)),
+
+    DSRRegionConnection("The Great Hollow", "Ash Lake"),
+
+    DSRRegionConnection("Sen's Fortress", "Sen's Fortress - After Cage Key", all_of=("Cage Key",)),
+    DSRRegionConnection("Sen's Fortress", "Anor Londo", all_of=("Iron Golem Defeated",)),
+
+    DSRRegionConnection("Anor Londo", "The Duke's Archives", all_of=("Lordvessel",)),
+    DSRRegionConnection("Anor Londo", "Painted World of Ariamis", all_of=("Peculiar Doll",)),
+    DSRRegionConnection("Painted World of Ariamis", "Painted World of Ariamis - After Annex Key", all_of=("Annex Key",)),
+
+    DSRRegionConnection("The Duke's Archives", "The Duke's Archives Cell Door", all_of=("Archive Tower Cell Key",)),
+    DSRRegionConnection("The Duke's Archives Cell Door", "The Duke's Archives - Getting out of Cell"),
+    DSRRegionConnection("The Duke's Archives - Getting out of Cell", "The Duke's Archives - After Archive Prison Extra Key", all_of=("Archive Prison Extra Key",)),
+    DSRRegionConnection("The Duke's Archives - After Archive Prison Extra Key", "The Duke's Archives - After Archive Tower Giant Door Key", all_of=("Archive Tower Giant Door Key",)),
+    DSRRegionConnection("The Duke's Archives - Getting out of Cell", "The Duke's Archives - Giant Cell", all_of=("Archive Tower Giant Cell Key",)),
+    DSRRegionConnection("The Duke's Archives - After Archive Tower Giant Door Key", "Crystal Cave"),
+    DSRRegionConnection("The Duke's Archives", "The Duke's Archives - First Arena after Seath's Death", all_of=("Seath the Scaleless Defeated",)),
+    DSRRegionConnection("Crystal Cave", "The Duke's Archives - First Arena after Seath's Death"),
+
+    DSRRegionConnection("The Catacombs", "The Catacombs - Door 1"),
+    DSRRegionConnection("The Catacombs - Door 1", "The Catacombs - After Door 1"),
+    DSRRegionConnection("The Catacombs - After Door 1", "Tomb of the Giants", all_of=("Ornstein and Smough Defeated",)),
+    DSRRegionConnection("Tomb of the Giants", "Tomb of the Giants - Behind Golden Fog Wall", all_of=("Lordvessel",)),
+
+    DSRRegionConnection("Lower New Londo Ruins", "The Abyss", all_of=("Covenant of Artorias",)),
+
+    DSRRegionConnection("Demon Ruins", "Demon Ruins - Behind Golden Fog Wall", all_of=("Lordvessel",)),
+    DSRRegionConnection("Demon Ruins - Behind Golden Fog Wall", "Lost Izalith", all_of=("Orange Charred Ring", "Centipede Demon Defeated")),
+    DSRRegionConnection("Demon Ruins - Behind Golden Fog Wall", "Demon Ruins Shortcut", all_of=("Demon Ruins Shortcut opened",)),
+    DSRRegionConnection("Lost Izalith", "Demon Ruins Shortcut", all_of=("Bed of Chaos Defeated",)),
+
+    # DLC Entrances
+    #DSRRegionConnection("Darkroot Basin", "Sanctuary Garden", all_of=("Broken Pendant",)),
+    #DSRRegionConnection("Sanctuary Garden", "Oolacile Sanctuary", all_of=("Sanctuary Guardian Defeated",)),
+    #DSRRegionConnection("Oolacile Sanctuary", "Royal Wood"),
+    #DSRRegionConnection("Royal Wood", "Oolacile Township", all_of=("Artorias the Abysswalker Defeated",)),
+    #DSRRegionConnection("Oolacile Township", "Oolacile Township - After Crest Key", all_of=("Crest Key",)),
+    #DSRRegionConnection("Oolacile Township - After Crest Key", "Royal Wood - After Hawkeye Gough"),
+    #DSRRegionConnection("Oolacile Township", "Chasm of the Abyss"),
+]
+
+# Added when start_with_firelink_unlocked is on, which also starts the player with these keys, so Firelink Shrine and
+# everything open from it is sphere 1 instead of sitting behind three spheres of Asylum doors
+asylum_key_names = ("Dungeon Cell Key", "Undead Asylum F2 East Key", "Big Pilgrim's Key")
+firelink_start_connection = DSRRegionConnection("Menu", "Firelink Shrine", all_of=asylum_key_names)
+
+
+class DSRCompiledRequirement(NamedTuple):
+    all_of: FrozenSet[str]
+    any_of: FrozenSet[str]
+
+
+def compile_requirement(connection: DSRRegionConnection) -> DSRCompiledRequirement:
+    return DSRCompiledRequirement(frozenset(connection.all_of), frozenset(connection.any_of))
+
+# Requirements turned into frozensets once at import, shared by every player
+compiled_requirements: List[DSRCompiledRequirement] = [compile_requirement(connection) for connection in region_connections]
+firelink_start_requirement = compile_requirement(firelink_start_connection)
+
+
+def make_access_rule(requirement: DSRCompiledRequirement, player: int) -> Optional[Callable[[CollectionState], bool]]:
+    # Returns None for unconditional entrances so they keep the framework's default rule.
+    # Rules test the progression bitmask DSRWorld.collect keeps in prog_items instead of one state.has per item.
+    all_mask = progression_mask(requirement.all_of)
+    any_mask = progression_mask(requirement.any_of)
+    if all_mask and any_mask:
+        return lambda state: (mask := state.prog_items[player][progression_mask_key]) & all_mask == all_mask and mask & any_mask != 0
+    if all_mask:
+        return lambda state: state.prog_items[player][progression_mask_key] & all_mask == all_mask
+    if any_mask:
+        return lambda state: state.prog_items[player][progression_mask_key] & any_mask != 0
+    return None
+
+def _build_region_requirements() -> Dict[str, Tuple[FrozenSet[str], ...]]:
+    # For every region, the minimal item sets that each open some path to it from Menu. Entrance rules are pure item
+    # checks, so a region is reachable exactly when the state holds all items of one of these sets.
+    # firelink_start_connection is counted for every player: it needs the same keys as the way through the Asylum, so
+    # the sets are the same with or without start_with_firelink_unlocked.
+    connections = region_connections + [firelink_start_connection]
+    def minimize(alternatives):
+        minimal = []
+        for alternative in sorted(set(alternatives), key=lambda items: (len(items), sorted(items))):
+            if not any(smaller <= alternative for smaller in minimal):
+                minimal.append(alternative)
+        return minimal
+
+    entrance_alternatives = [
+        [requirement.all_of | {item} for item in requirement.any_of] if requirement.any_of else [requirement.all_of]
+        for requirement in compiled_requirements + [firelink_start_requirement]
+    ]
+    requirements: Dict[str, List[FrozenSet[str]]] = {"Menu": [frozenset()]}
+    changed = True
+    while changed:
+        changed = False
+        for connection, alternatives in zip(connections, entrance_alternatives):
+            if connection.from_region not in requirements:
+                continue
+            current = requirements.get(connection.to_region, [])
+            updated = minimize(current + [path | entrance for path in requirements[connection.from_region] for entrance in alternatives])
+            if updated != current:
+                requirements[connection.to_region] = updated
+                changed = True
+    return {region: tuple(alternatives) for region, alternatives in requirements.items()}
+
+
+region_requirements: Dict[str, Tuple[FrozenSet[str], ...]] = _build_region_requirements()
+
+# Items needed on every path to a region: one of those can never be placed in the region itself
+region_necessary_items: Dict[str, FrozenSet[str]] = {
+    region: frozenset.intersection(*alternatives) for region, alternatives in region_requirements.items()
+}
+
+
+
+def can_reach_region(state: CollectionState, region_name: str, player: int) -> bool:
+    # Same answer as state.can_reach(region_name, "Region", player) without sweeping the entrances
+    mask = state.prog_items[player][progression_mask_key]
+    return any(mask & required == required for required in map(progression_mask, region_requirements.get(region_name, ())))
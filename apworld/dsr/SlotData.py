@@ -0,0 +1,86 @@
+import base64
+import sys
+from array import array
+from typing import Dict, List, NamedTuple, Optional
+
+from BaseClasses import MultiWorld
+
+from . import Items, Locations
+
+
+# Bumped whenever the layout of the compact slot data arrays changes
+COMPACT_SLOT_DATA_FORMAT = 1
+COMPACT_NONE_VALUE = -1
+
+
+class DSRSlotDataBucket(NamedTuple):
+    items_id: List[int]
+    items_address: List[int]
+    locations_id: List[int]
+    locations_address: List[int]
+    locations_target: List[int]
+
+
+def build_slot_data_buckets(multiworld: MultiWorld, game: str) -> Dict[int, DSRSlotDataBucket]:
+    # Integer indexing only: an item's dsr_code is its id - base_id and a location's vanilla dsr_code comes from
+    # Locations.vanilla_dsr_codes. Events have no id, they fall back to their row in the definition stores.
+    base_id = Items.base_id
+    item_store = Items.item_store
+    location_store = Locations.location_store
+    vanilla_dsr_codes = Locations.vanilla_dsr_codes
+    buckets = {player: DSRSlotDataBucket([], [], [], [], []) for player in multiworld.get_game_players(game)}
+
+    for location in multiworld.get_filled_locations():
+        item = location.item
+        receiver = buckets.get(item.player)
+        sender = buckets.get(location.player)
+        if receiver is not None:
+            #the item is sent to a DSR player
+            if item.code is not None:
+                item_dsr_code = item.code - base_id
+            else:
+                item_dsr_code = item_store.dsr_codes[item_store.row_by_name[item.name]]
+            receiver.items_id.append(item.code)
+            receiver.items_address.append(item_dsr_code)
+
+        if sender is not None:
+            #the location check belongs to a DSR player
+            if location.address is not None:
+                sender.locations_address.append(vanilla_dsr_codes[location.address - base_id])
+            else:
+                sender.locations_address.append(location_store.dsr_codes[location_store.row_by_name[location.name]])
+            sender.locations_id.append(location.address)
+            if item.player == location.player:
+                # receiver is sender here, so item_dsr_code was set above
+                sender.locations_target.append(item_dsr_code)
+            else:
+                sender.locations_target.append(0)
+
+    return buckets
+
+
+def encode_compact_array(values: List[Optional[int]]) -> str:
+    # Delta-encoded little-endian int32 array, base64 encoded. None (event items and locations) is stored as -1
+    # before delta encoding, so a running sum on the client restores the original values.
+    packed = array("i")
+    previous = 0
+    for value in values:
+        value = COMPACT_NONE_VALUE if value is None else value
+        packed.append(value - previous)
+        previous = value
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def decode_compact_array(encoded: str) -> List[Optional[int]]:
+    packed = array("i")
+    packed.frombytes(base64.b64decode(encoded))
+    if sys.byteorder != "little":
+        packed.byteswap()
+    values = []
+    previous = 0
+    for delta in packed:
+        previous += delta
+        values.append(None if previous == COMPACT_NONE_VALUE else previous)
+    return values
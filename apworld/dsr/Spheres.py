@@ -0,0 +1,38 @@
+from typing import Dict, List
+
+from BaseClasses import CollectionState, Location, MultiWorld
+
+from .Regions import can_reach_region
+
+
+def build_sphere_layouts(multiworld: MultiWorld, game: str) -> Dict[int, List[List[Location]]]:
+    # Our rules only read the player's own items, so every DSR player can share one state: each layout only collects
+    # its own player's items into it. A CollectionState is built over every player of the multiworld, making one per
+    # DSR slot was quadratic in big seeds.
+    state = CollectionState(multiworld)
+    return {player: build_sphere_layout(multiworld, player, state) for player in multiworld.get_game_players(game)}
+
+
+def build_sphere_layout(multiworld: MultiWorld, player: int, state: CollectionState) -> List[List[Location]]:
+    # Local spheres over one DSR world's own locations: sphere n holds the locations reachable with our items found in
+    # the spheres before it, starting from our precollected items. Items placed for us in other worlds are not
+    # collected, their spheres belong to other games and mapping them onto ours would show a late foreign key as sphere
+    # 1, so locations gated on them are left out. Events count like items, as in the playthrough: the Asylum keys found
+    # in sphere 1 open sphere 2. Spheres only list addressed locations, so a sphere that only reached events is empty.
+    def can_reach(location: Location) -> bool:
+        # Region reachability from the precomputed requirements instead of Region.can_reach's entrance sweep
+        return can_reach_region(state, location.parent_region.name, player) and location.access_rule(state)
+
+    spheres: List[List[Location]] = []
+    remaining = multiworld.get_filled_locations(player)
+    while remaining:
+        reachable = [location for location in remaining if can_reach(location)]
+        if not reachable:
+            break
+        spheres.append([location for location in reachable if location.address is not None])
+        reached = set(reachable)
+        remaining = [location for location in remaining if location not in reached]
+        for location in reachable:
+            if location.item.player == player and location.item.advancement:
+                state.collect(location.item, True, location)
+    return spheres
@@ -0,0 +1,62 @@
+import functools
+from collections import Counter
+from typing import List
+
+from . import Items, Locations
+from .Regions import region_connections, region_requirements
+
+
+def find_table_errors() -> List[str]:
+    # Static checks over the item, location and region tables, in one pass over the region graph. Every entrance rule is
+    # a pure item check, so a region missing from region_requirements cannot be reached even with every item.
+    # Works on the raw location rows: building location_store looks every default item up, so a bad row would raise a
+    # bare KeyError there before anything could be reported.
+    errors: List[str] = []
+    tables = Locations._load_location_tables()
+    order = Locations.location_table_order
+    progression_items = Items.progression_item_bits
+
+    for region_name in tables.keys() - set(order):
+        errors.append(f"Location table {region_name!r} is not in location_table_order, create_regions never builds it")
+    for region_name in set(order) - tables.keys():
+        errors.append(f"location_table_order lists {region_name!r}, which has no location table")
+
+    known_regions = {"Menu", *order}
+    for connection in region_connections:
+        for region_name in (connection.from_region, connection.to_region):
+            if region_name not in known_regions:
+                errors.append(f"Connection {connection.from_region} -> {connection.to_region} uses unknown region {region_name!r}")
+        for item_name in connection.all_of + connection.any_of:
+            if item_name not in progression_items:
+                errors.append(f"Connection {connection.from_region} -> {connection.to_region} requires {item_name!r}, which is not a progression item")
+
+    for region_name in order:
+        if region_name not in region_requirements:
+            errors.append(f"Region {region_name!r} is unreachable with all items")
+
+    all_locations = [location_data for table in tables.values() for location_data in table]
+    for kind, values in (("location id", [location_data.id for location_data in all_locations]),
+                         ("location name", [location_data.name for location_data in all_locations])):
+        for value, count in Counter(values).items():
+            if count > 1:
+                errors.append(f"Duplicate {kind} {value!r} ({count} entries)")
+    for location_data in all_locations:
+        if location_data.default_item not in Items.item_dictionary:
+            errors.append(f"Location {location_data.name!r} has unknown default item {location_data.default_item!r}")
+
+    location_names = {location_data.name for location_data in all_locations}
+    location_rules = list(Locations.snuggly_trades.items()) + list(Locations.location_requirements.items())
+    for location_name, item_name in location_rules:
+        if location_name not in location_names:
+            errors.append(f"Rule for unknown location {location_name!r}")
+        if item_name not in progression_items:
+            errors.append(f"Rule for {location_name!r} requires {item_name!r}, which is not a progression item")
+    return errors
+
+
+@functools.lru_cache(maxsize=None)
+def validate_tables() -> None:
+    # Runs once per process, from generate_early, so a broken table fails the generation before anything is built
+    errors = find_table_errors()
+    if errors:
+        raise Exception("Dark Souls Remastered tables are inconsistent:\n" + "\n".join(errors))
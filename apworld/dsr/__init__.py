@@ -1,15 +1,21 @@
 # world/dsr/__init__.py
-from typing import Dict, Set, List
+from collections import deque
+from typing import Deque, Dict, FrozenSet, Set, List, Optional, TextIO, Tuple
 
-from BaseClasses import MultiWorld, Region, Item, Entrance, Tutorial, ItemClassification
-from Options import Toggle
+from BaseClasses import MultiWorld, Region, Item, Location, Entrance, Tutorial, ItemClassification, CollectionState
+from Options import OptionError, Toggle
 
 from worlds.AutoWorld import World, WebWorld
 from worlds.generic.Rules import set_rule, add_rule, add_item_rule
 
-from .Items import DSRItem, DSRItemCategory, item_dictionary, key_item_names, item_descriptions, BuildItemPool
-from .Locations import DSRLocation, DSRLocationCategory, location_tables, location_dictionary, location_skip_categories
+from . import Items, Locations, _ids
+from .Items import DSRItem, DSRItemCategory, item_descriptions, progression_mask_key, BuildItemPool
+from .Locations import DSRLocation, DSRLocationCategory, location_skip_categories, location_table_order, snuggly_trades, location_requirements
+from .Regions import DSRCompiledRequirement, asylum_key_names, firelink_start_connection, firelink_start_requirement, region_connections, compiled_requirements, make_access_rule, region_necessary_items
 from .Options import DSROption
+from .Validation import validate_tables
+from .Spheres import build_sphere_layouts
+from .SlotData import DSRSlotDataBucket, build_slot_data_buckets, encode_compact_array, COMPACT_SLOT_DATA_FORMAT
 
 class DSRWeb(WebWorld):
     bug_report_page = ""
@@ -41,10 +47,9 @@ class DSRWorld(World):
     base_id = 11110000
     enabled_location_categories: Set[DSRLocationCategory]
     required_client_version = (0, 5, 1)
-    item_name_to_id = DSRItem.get_name_to_id()
-    location_name_to_id = DSRLocation.get_name_to_id()
-    item_name_groups = {
-    }
+    item_name_to_id = _ids.item_name_to_id
+    location_name_to_id = _ids.location_name_to_id
+    item_name_groups = _ids.item_name_groups
     item_descriptions = item_descriptions
 
 
@@ -54,188 +59,64 @@ class DSRWorld(World):
         self.locked_locations = []
         self.main_path_locations = []
         self.enabled_location_categories = set()
+        self.skip_locations_by_item: Dict[str, Deque[DSRLocation]] = {}
+        self.sphere_layout: Optional[List[List[DSRLocation]]] = None
+        self.slot_data_bucket: Optional[DSRSlotDataBucket] = None
+        self.capped_location_names: FrozenSet[str] = frozenset()
 
 
     def generate_early(self):
+        validate_tables()
+        # Events, bosses and bonfires hold the flags the logic runs on, they always stay vanilla (location_skip_categories)
         self.enabled_location_categories.add(DSRLocationCategory.EVENT),
         self.enabled_location_categories.add(DSRLocationCategory.BOSS),
-        self.enabled_location_categories.add(DSRLocationCategory.ITEM_LOT),
         self.enabled_location_categories.add(DSRLocationCategory.BONFIRE),
-        self.enabled_location_categories.add(DSRLocationCategory.DOOR),
+        if self.options.enable_item_lots.value:
+            self.enabled_location_categories.add(DSRLocationCategory.ITEM_LOT)
+        if self.options.enable_doors.value:
+            self.enabled_location_categories.add(DSRLocationCategory.DOOR)
+        if self.options.enable_enemy_drops.value:
+            self.enabled_location_categories.add(DSRLocationCategory.ENEMY_DROP)
+        if self.options.enable_snuggly_trades.value:
+            self.enabled_location_categories.add(DSRLocationCategory.SNUGGLY_TRADE)
+
+        # Key items that do not fit in the free locations are started with (see BuildItemPool), guaranteed items cannot be
+        guaranteed_count = sum(self.options.guaranteed_items.value.values())
+        max_locations = self.options.max_randomized_locations.value
+        if max_locations:
+            # A lower cap would only move key items to the start inventory, keep room for them and the guaranteed items
+            key_item_count = len(Items._pool_key_items) + (1 if self.options.enable_masterkey.value else 0)
+            max_locations = max(max_locations, key_item_count + guaranteed_count)
+            self.capped_location_names = Locations.get_capped_location_names(frozenset(self.enabled_location_categories), max_locations)
+        free_location_count = Locations.count_free_locations(frozenset(self.enabled_location_categories), max_locations)
+        if guaranteed_count > free_location_count:
+            raise OptionError(f"Dark Souls Remastered: {self.multiworld.player_name[self.player]} guarantees {guaranteed_count} items "
+                              f"but only has {free_location_count} free locations, enable more location categories or raise the location cap")
+
+        if self.options.start_with_firelink_unlocked.value:
+            # Their vanilla spots stay locked events, the copies picked up there do nothing
+            for item_name in asylum_key_names:
+                self.multiworld.push_precollected(self.create_item(item_name))
 
     def create_regions(self):
         # Create Regions
         regions: Dict[str, Region] = {}
         regions["Menu"] = self.create_region("Menu", [])
-        regions.update({region_name: self.create_region(region_name, location_tables[region_name]) for region_name in [
-            "Undead Asylum Cell",
-            "Undead Asylum Cell Door",
-            "Northern Undead Asylum F2 East Door",
-            "Northern Undead Asylum", 
-            "Northern Undead Asylum - After F2 East Door", 
-            "Undead Asylum Big Pilgrim Door",
-            "Firelink Shrine", 
-            "Upper Undead Burg", 
-            "Upper Undead Burg - Pine Resin Chest",
-            "Undead Parish", 
-            "Firelink Shrine - After Undead Parish Elevator",
-            "Northern Undead Asylum - Second Visit F2 West Door",
-            "Northern Undead Asylum - Second Visit Snuggly Trades",
-            "Northern Undead Asylum - Second Visit Behind F2 West Door",
-            "Undead Burg Basement Door",
-            "Lower Undead Burg", 
-            "Lower Undead Burg - After Residence Key",
-            "Watchtower Basement",
-            "Depths", 
-            "Depths - After Sewer Chamber Key",
-            "Depths to Blighttown Door",
-            "Blighttown", 
-            "Valley of the Drakes", 
-            "Valley of the Drakes - After Defeating Four Kings", 
-            "Door between Upper New Londo and Valley of the Drakes",
-            "Darkroot Basin", 
-            "Darkroot Garden", 
-            "Darkroot Garden - Behind Artorias Door", 
-            "The Great Hollow", 
-            "Ash Lake", 
-            "Sen's Fortress",
-            "Sen's Fortress - After Cage Key",
-            "Anor Londo", 
-            "Painted World of Ariamis",
-            "Painted World of Ariamis - After Annex Key",
-            "Upper New Londo Ruins",
-            "New Londo Ruins Door to the Seal",
-            "Lower New Londo Ruins", 
-            "The Abyss", 
-            "The Duke's Archives", 
-            "The Duke's Archives Cell Door",
-            "The Duke's Archives - Getting out of Cell",
-            "The Duke's Archives - After Archive Prison Extra Key",
-            "The Duke's Archives - After Archive Tower Giant Door Key", 
-            "The Duke's Archives - Giant Cell",
-            "Crystal Cave", 
-            "The Duke's Archives - First Arena after Seath's Death", 
-            "Demon Ruins", 
-            "Demon Ruins - Behind Golden Fog Wall",
-            "Demon Ruins Shortcut",
-            "Lost Izalith", 
-            "The Catacombs", 
-            "The Catacombs - Door 1",
-            "The Catacombs - After Door 1",
-            "Tomb of the Giants", 
-            "Tomb of the Giants - Behind Golden Fog Wall",
-            "Kiln of the First Flame", 
-            #"Sanctuary Garden", 
-            #"Oolacile Sanctuary", 
-            #"Royal Wood", 
-            #"Royal Wood - After Hawkeye Gough",
-            #"Oolacile Township", 
-            #"Oolacile Township - After Crest Key",
-            #"Chasm of the Abyss", 
-                ]})
+        regions.update({region_name: self.create_region(region_name, Locations.location_tables[region_name]) for region_name in location_table_order})
        
         # Connect Regions
-        def create_connection(from_region: str, to_region: str, rule = None):
-            connection = Entrance(self.player, f"{from_region} -> {to_region}", regions[from_region])
-            regions[from_region].exits.append(connection)
-            connection.connect(regions[to_region], rule)
-            #print(f"Connecting {from_region} to {to_region} Using entrance: " + connection.name) 
-        create_connection("Menu", "Undead Asylum Cell")    
-        
-        create_connection("Undead Asylum Cell", "Undead Asylum Cell Door") 
-        create_connection("Undead Asylum Cell Door", "Northern Undead Asylum")
-        create_connection("Northern Undead Asylum", "Northern Undead Asylum F2 East Door")
-        create_connection("Northern Undead Asylum F2 East Door", "Northern Undead Asylum - After F2 East Door")
-        create_connection("Northern Undead Asylum - After F2 East Door", "Undead Asylum Big Pilgrim Door")
-        create_connection("Undead Asylum Big Pilgrim Door", "Firelink Shrine")
-
-        create_connection("Firelink Shrine", "Upper Undead Burg")
-        create_connection("Firelink Shrine", "The Catacombs")
-        create_connection("Firelink Shrine", "Upper New Londo Ruins")
-        create_connection("Firelink Shrine - After Undead Parish Elevator", "Northern Undead Asylum - Second Visit Snuggly Trades")
-        create_connection("Firelink Shrine", "Kiln of the First Flame")
-        
-        create_connection("Northern Undead Asylum - Second Visit Snuggly Trades", "Northern Undead Asylum - Second Visit F2 West Door")
-        create_connection("Northern Undead Asylum - Second Visit F2 West Door", "Northern Undead Asylum - Second Visit Behind F2 West Door")
-        
-        create_connection("Upper Undead Burg", "Undead Burg Basement Door")
-        create_connection("Upper Undead Burg", "Undead Parish")
-        create_connection("Upper Undead Burg", "Darkroot Basin")
-        create_connection("Upper Undead Burg", "Upper Undead Burg - Pine Resin Chest")
-        
-        create_connection("Upper Undead Burg", "Watchtower Basement")
-        create_connection("Darkroot Basin", "Watchtower Basement")
-
-        create_connection("Undead Parish", "Firelink Shrine - After Undead Parish Elevator")
-        create_connection("Undead Parish", "Darkroot Garden")
-        create_connection("Undead Parish", "Sen's Fortress")
-
-        create_connection("Darkroot Garden", "Darkroot Basin")
-        create_connection("Darkroot Garden", "Darkroot Garden - Behind Artorias Door")
-
-        create_connection("Undead Burg Basement Door", "Lower Undead Burg")
-        create_connection("Lower Undead Burg", "Depths")
-        create_connection("Lower Undead Burg", "Lower Undead Burg - After Residence Key")
-
-        create_connection("Upper New Londo Ruins", "New Londo Ruins Door to the Seal")
-        create_connection("New Londo Ruins Door to the Seal", "Lower New Londo Ruins")
-        
-        create_connection("Upper New Londo Ruins", "Door between Upper New Londo and Valley of the Drakes")
-        create_connection("Door between Upper New Londo and Valley of the Drakes", "Valley of the Drakes")
-
-        create_connection("Lower New Londo Ruins", "Valley of the Drakes")
-
-        create_connection("Depths", "Depths - After Sewer Chamber Key")
-        create_connection("Depths", "Depths to Blighttown Door")
-
-        create_connection("Valley of the Drakes", "Blighttown")
-        create_connection("Valley of the Drakes", "Darkroot Basin")
-        create_connection("Valley of the Drakes", "Valley of the Drakes - After Defeating Four Kings")
-
-        create_connection("Depths to Blighttown Door", "Blighttown")
-        create_connection("Blighttown", "Depths to Blighttown Door")
-        create_connection("Blighttown", "Demon Ruins")
-        create_connection("Blighttown", "The Great Hollow")
-
-        create_connection("The Great Hollow", "Ash Lake")
-
-        create_connection("Sen's Fortress", "Sen's Fortress - After Cage Key")
-        create_connection("Sen's Fortress", "Anor Londo")
-
-        create_connection("Anor Londo", "The Duke's Archives")
-        create_connection("Anor Londo", "Painted World of Ariamis")
-        create_connection("Painted World of Ariamis", "Painted World of Ariamis - After Annex Key")
-
-        create_connection("The Duke's Archives", "The Duke's Archives Cell Door")
-        create_connection("The Duke's Archives Cell Door", "The Duke's Archives - Getting out of Cell")
-        create_connection("The Duke's Archives - Getting out of Cell", "The Duke's Archives - After Archive Prison Extra Key")
-        create_connection("The Duke's Archives - After Archive Prison Extra Key", "The Duke's Archives - After Archive Tower Giant Door Key")
-        create_connection("The Duke's Archives - Getting out of Cell", "The Duke's Archives - Giant Cell")
-        create_connection("The Duke's Archives - After Archive Tower Giant Door Key", "Crystal Cave")
-        create_connection("The Duke's Archives", "The Duke's Archives - First Arena after Seath's Death")
-        create_connection("Crystal Cave", "The Duke's Archives - First Arena after Seath's Death")
-
-        create_connection("The Catacombs", "The Catacombs - Door 1")
-        create_connection("The Catacombs - Door 1", "The Catacombs - After Door 1")
-        create_connection("The Catacombs - After Door 1", "Tomb of the Giants")
-        create_connection("Tomb of the Giants", "Tomb of the Giants - Behind Golden Fog Wall")
-
-        create_connection("Lower New Londo Ruins", "The Abyss")
-
-        create_connection("Demon Ruins", "Demon Ruins - Behind Golden Fog Wall")
-        create_connection("Demon Ruins - Behind Golden Fog Wall", "Lost Izalith")
-        create_connection("Demon Ruins - Behind Golden Fog Wall", "Demon Ruins Shortcut")
-        create_connection("Lost Izalith", "Demon Ruins Shortcut")
-
-
-        # DLC Entrances
-        #create_connection("Darkroot Basin", "Sanctuary Garden")
-        #create_connection("Sanctuary Garden", "Oolacile Sanctuary")
-        #create_connection("Oolacile Sanctuary", "Royal Wood")
-        #create_connection("Royal Wood", "Oolacile Township")
-        #create_connection("Oolacile Township", "Oolacile Township - After Crest Key")
-        #create_connection("Oolacile Township - After Crest Key", "Royal Wood - After Hawkeye Gough")
-        #create_connection("Oolacile Township", "Chasm of the Abyss")
+        connections = list(zip(region_connections, compiled_requirements))
+        if self.options.start_with_firelink_unlocked.value:
+            connections.append((firelink_start_connection, firelink_start_requirement))
+        for connection, requirement in connections:
+            entrance = Entrance(self.player, f"{connection.from_region} -> {connection.to_region}", regions[connection.from_region])
+            regions[connection.from_region].exits.append(entrance)
+            entrance.connect(regions[connection.to_region])
+            # Entrance.connect takes no rule, unconditional entrances keep the default one
+            rule = make_access_rule(requirement, self.player)
+            if rule:
+                entrance.access_rule = rule
+            #print(f"Connecting {connection.from_region} to {connection.to_region} Using entrance: " + entrance.name)
       
         
     # For each region, add the associated locations retrieved from the corresponding location_table
@@ -244,13 +125,16 @@ class DSRWorld(World):
         #print("location table size: " + str(len(location_table)))
         for location in location_table:
             #print("Creating location: " + location.name)
-            if location.category in self.enabled_location_categories and location.category not in location_skip_categories:# [DSRLocationCategory.EVENT, DSRLocationCategory.DOOR]:
+            randomized = location.category in self.enabled_location_categories and location.name not in self.capped_location_names
+            if (not randomized and location.category not in location_skip_categories
+                    and Items.item_classification_table[location.default_item][1] != ItemClassification.progression):
+                # Disabled or over the location cap, and its vanilla item gates nothing: leave it out instead of creating a locked filler event
+                continue
+            if randomized and location.category not in location_skip_categories:# [DSRLocationCategory.EVENT, DSRLocationCategory.DOOR]:
                 #print("Adding location: " + location.name + " with default item " + location.default_item)
                 new_location = DSRLocation(
                     self.player,
                     location.name,
-                    location.category,
-                    location.default_item,
                     self.location_name_to_id[location.name],
                     new_region
                 )
@@ -263,8 +147,6 @@ class DSRWorld(World):
                 new_location = DSRLocation(
                     self.player,
                     location.name,
-                    location.category,
-                    location.default_item,
                     None,
                     new_region
                 )
@@ -272,6 +154,10 @@ class DSRWorld(World):
                 new_location.place_locked_item(event_item)
                 #print("Placing event: " + event_item.name + " in location: " + location.name)
 
+            # Index the locations create_items will lock a skip item into, in creation order
+            if Items.item_dictionary[location.default_item].category == DSRItemCategory.SKIP or location.category in location_skip_categories:
+                self.skip_locations_by_item.setdefault(location.default_item, deque()).append(new_location)
+
             new_region.locations.append(new_location)
         #print("created " + str(len(new_region.locations)) + " locations")
         self.multiworld.regions.append(new_region)
@@ -280,178 +166,147 @@ class DSRWorld(World):
 
 
     def create_items(self):
-        skip_items: List[DSRItem] = []
-        itempool: List[DSRItem] = []
-        itempoolSize = 0
+        # Items are created for every DSR player at once in stage_create_items
+        pass
+
+    def scan_item_locations(self) -> Tuple[List[str], List[str], int]:
+        # Our locations split into the skip items locked in place, the vanilla progression kept in the pool, and how
+        # many free locations BuildItemPool fills. Depends only on the location settings, see stage_create_items.
+        skip_item_names: List[str] = []
+        pool_item_names: List[str] = []
+        removable_count = 0
         
         #print("Creating items")
         for location in self.multiworld.get_locations(self.player):            
-            item_data = item_dictionary[location.default_item_name]
-            if item_data.category in [DSRItemCategory.SKIP] or location.category in location_skip_categories:# [DSRLocationCategory.EVENT]:                
-                #print("Adding skip item: " + location.default_item_name)
-                skip_items.append(self.create_item(location.default_item_name))
-            elif location.category in self.enabled_location_categories:
-                #print("Adding item: " + location.default_item_name)
-                itempoolSize += 1
-                itempool.append(self.create_item(location.default_item_name))
-        
-        #print("Requesting itempool size: " + str(itempoolSize))
-        foo = BuildItemPool(itempoolSize, self.options)
-        #print("Created item pool size: " + str(len(foo)))
-
-        removable_items = [item for item in itempool if item.classification != ItemClassification.progression]
-        #print("marked " + str(len(removable_items)) + " items as removable")
-        
-        for item in removable_items:
-            #print("removable item: " + item.name)
-            itempool.remove(item)
-            itempool.append(self.create_item(foo.pop().name))
-
-        # Add regular items to itempool
-        self.multiworld.itempool += itempool
-
-        # Handle SKIP items separately
-        for skip_item in skip_items:
-            location = next(loc for loc in self.multiworld.get_locations(self.player) if loc.default_item_name == skip_item.name)
-            location.place_locked_item(skip_item)
-            #self.multiworld.itempool.append(skip_item)
-            #print("Placing skip item: " + skip_item.name + " in location: " + location.name)
-        
-        #print("Final Item pool: ")
-        #for item in self.multiworld.itempool:
-            #print(item.name)
+            # Both come from the shared location definitions, read them once
+            category, default_item_name = location.category, location.default_item_name
+            item_data = Items.item_dictionary[default_item_name]
+            if item_data.category in [DSRItemCategory.SKIP] or category in location_skip_categories:# [DSRLocationCategory.EVENT]:                
+                #print("Adding skip item: " + default_item_name)
+                skip_item_names.append(default_item_name)
+            elif category in self.enabled_location_categories and location.name not in self.capped_location_names:
+                #print("Adding item: " + default_item_name)
+                # Vanilla progression stays in the pool, everything else is replaced from the built pool
+                if Items.item_classification_table[default_item_name][1] == ItemClassification.progression:
+                    pool_item_names.append(default_item_name)
+                else:
+                    removable_count += 1
+        return skip_item_names, pool_item_names, removable_count
+
+    @classmethod
+    def stage_create_items(cls, multiworld: MultiWorld) -> None:
+        # Runs once after every world's create_items. Players with the same location settings have the same locations
+        # in the same order, so they share one scan of them. Items are added to the pool in player order.
+        scans: Dict[Tuple[FrozenSet[DSRLocationCategory], FrozenSet[str]], Tuple[List[str], List[str], int]] = {}
+        for player in multiworld.get_game_players(cls.game):
+            world = multiworld.worlds[player]
+            settings = (frozenset(world.enabled_location_categories), world.capped_location_names)
+            if settings not in scans:
+                scans[settings] = world.scan_item_locations()
+            skip_item_names, pool_item_names, removable_count = scans[settings]
+
+            itempool = [world.create_item(name) for name in pool_item_names]
+            foo, starting_items = BuildItemPool(removable_count, world.options, world.random)
+            #print("Created item pool size: " + str(len(foo)))
+            itempool += [world.create_item(item_data.name) for item_data in foo]
+            for item_data in starting_items:
+                multiworld.push_precollected(world.create_item(item_data.name))
+
+            # Add regular items to itempool
+            multiworld.itempool += itempool
+
+            # Handle SKIP items separately
+            for name in skip_item_names:
+                location = world.skip_locations_by_item[name].popleft()
+                location.place_locked_item(world.create_item(name))
+                #print("Placing skip item: " + name + " in location: " + location.name)
 
 
     def create_item(self, name: str) -> Item:
-        useful_categories = {
-        }
-        data = self.item_name_to_id[name]
+        code, item_classification = Items.item_classification_table[name]
+        return DSRItem(name, item_classification, code, self.player)
 
-        if name in key_item_names or item_dictionary[name].category in [DSRItemCategory.EVENT, DSRItemCategory.KEY_ITEM]:
-            item_classification = ItemClassification.progression
-        elif item_dictionary[name].category in useful_categories:
-            item_classification = ItemClassification.useful
-        else:
-            item_classification = ItemClassification.filler
 
-        return DSRItem(name, item_classification, data, self.player)
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        changed = super().collect(state, item)
+        if changed:
+            bit = Items.progression_item_bits.get(item.name, 0)
+            state.prog_items[self.player][progression_mask_key] |= bit
+        return changed
 
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        changed = super().remove(state, item)
+        # Only clear the bit once the last copy is gone
+        if changed and state.prog_items[self.player][item.name] < 1:
+            bit = Items.progression_item_bits.get(item.name, 0)
+            state.prog_items[self.player][progression_mask_key] &= ~bit
+        return changed
 
     def get_filler_item_name(self) -> str:
         return "1000 Souls"
     
     def set_rules(self) -> None:           
         #print("Setting rules")   
+        # Locations without a requirement keep the framework's default access rule
+        self.multiworld.completion_condition[self.player] = lambda state: state.has("Gwyn, Lord of Cinder Defeated", self.player)
+
+        # Entrance rules are attached in create_regions from Regions.region_connections
+
+        # Never place one of our items in a region it is required to reach. One rule per region, set directly on the
+        # locations that still have the default rule instead of wrapping each of them in a new closure
         for region in self.multiworld.get_regions(self.player):
+            necessary_items = region_necessary_items.get(region.name)
+            if not necessary_items:
+                continue
+            item_rule = lambda item, necessary_items=necessary_items: item.player != self.player or item.name not in necessary_items
             for location in region.locations:
-                    set_rule(location, lambda state: True)        
-        self.multiworld.completion_condition[self.player] = lambda state: state.has("Gwyn, Lord of Cinder Defeated", self.player)
-          
-        set_rule(self.multiworld.get_entrance("Undead Asylum Cell -> Undead Asylum Cell Door", self.player), lambda state: state.has("Dungeon Cell Key", self.player))   
-        #set_rule(self.multiworld.get_entrance("Undead Asylum Cell Door -> Northern Undead Asylum", self.player), lambda state: state.has("Dungeon Cell Key", self.player))      
-        set_rule(self.multiworld.get_entrance("Northern Undead Asylum -> Northern Undead Asylum F2 East Door", self.player), lambda state: state.has("Undead Asylum F2 East Key", self.player))
-        set_rule(self.multiworld.get_entrance("Northern Undead Asylum - After F2 East Door -> Undead Asylum Big Pilgrim Door", self.player), lambda state: state.has("Big Pilgrim's Key", self.player))
-
-        set_rule(self.multiworld.get_entrance("Upper Undead Burg -> Undead Burg Basement Door", self.player), lambda state:state.has("Taurus Demon Defeated", self.player) and state.has ("Basement Key", self.player))
-        set_rule(self.multiworld.get_entrance("Upper Undead Burg -> Upper Undead Burg - Pine Resin Chest", self.player), lambda state: state.has("Master Key", self.player) or state.has("Residence Key", self.player))        
-        set_rule(self.multiworld.get_entrance("Upper Undead Burg -> Undead Parish", self.player), lambda state: state.has("Taurus Demon Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("Upper Undead Burg -> Watchtower Basement", self.player), lambda state: state.has("Master Key", self.player) or state.has("Watchtower Basement Key", self.player))
-        
-        set_rule(self.multiworld.get_location("Snuggly: Pendant -> Souvenir of Reprisal", self.player), lambda state: state.has("Pendant", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Rubbish -> Titanite Chunk", self.player), lambda state: state.has("Rubbish", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Sunlight Medal -> White Titanite Chunk", self.player), lambda state: state.has("Sunlight Medal", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Bloodred Moss Clump -> Twinkling Titanite", self.player), lambda state: state.has("Bloodred Moss Clump", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Purple Moss Clump -> Twinkling Titanite", self.player), lambda state: state.has("Purple Moss Clump", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Blooming Purple Moss Clump -> Twinkling Titanite x2", self.player), lambda state: state.has("Blooming Purple Moss Clump", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Cracked Red Eye Orb -> Purging Stone x2", self.player), lambda state: state.has("Cracked Red Eye Orb", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Humanity -> Ring of Sacrifice", self.player), lambda state: state.has("Humanity", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Twin Humanities -> Rare Ring of Sacrifice", self.player), lambda state: state.has("Twin Humanities", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Dung Pie -> Demon Titanite", self.player), lambda state: state.has("Dung Pie", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Pyromancy Flame -> Red Titanite Chunk", self.player), lambda state: state.has("Pyromancy Flame", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Pyromancy Flame (Ascended) -> Red Titanite Slab", self.player), lambda state: state.has("Pyromancy Flame (Ascended)", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Egg Vermifuge -> Dragon Scale", self.player), lambda state: state.has("Egg Vermifuge", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Sunlight Maggot -> Old Witch's Ring", self.player), lambda state: state.has("Sunlight Maggot", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Sack -> Demon's Great Hammer", self.player), lambda state: state.has("Sack", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Skull Lantern -> Ring of Fog", self.player), lambda state: state.has("Skull Lantern", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Ring of the Sun Princess -> Divine Blessing x2", self.player), lambda state: state.has("Ring of the Sun Princess", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Xanthous Crown -> Ring of Favor and Protection", self.player), lambda state: state.has("Xanthous Crown", self.player))
-        set_rule(self.multiworld.get_location("Snuggly: Soul of Manus -> Sorcery: Pursuers", self.player), lambda state: state.has("Soul of Manus", self.player))
-        
-        set_rule(self.multiworld.get_entrance("Darkroot Basin -> Watchtower Basement", self.player), lambda state: state.has("Master Key", self.player) or state.has("Watchtower Basement Key", self.player))
-        set_rule(self.multiworld.get_entrance("Northern Undead Asylum - Second Visit Snuggly Trades -> Northern Undead Asylum - Second Visit F2 West Door", self.player), lambda state: state.has("Undead Asylum F2 West Key", self.player))
-        set_rule(self.multiworld.get_entrance("Darkroot Garden -> Darkroot Garden - Behind Artorias Door", self.player), lambda state: state.has("Crest of Artorias", self.player))
-        set_rule(self.multiworld.get_entrance("Lower Undead Burg -> Depths", self.player), lambda state: state.has("Key to Depths", self.player))
-        set_rule(self.multiworld.get_entrance("Lower Undead Burg -> Lower Undead Burg - After Residence Key", self.player), lambda state: state.has("Residence Key", self.player))
-        set_rule(self.multiworld.get_entrance("Upper New Londo Ruins -> Door between Upper New Londo and Valley of the Drakes", self.player), lambda state: state.has("Key to New Londo Ruins", self.player) or state.has("Master Key", self.player))
-        set_rule(self.multiworld.get_entrance("Door between Upper New Londo and Valley of the Drakes -> Valley of the Drakes", self.player), lambda state: state.has("Key to New Londo Ruins", self.player) or state.has("Master Key", self.player))
-
-        set_rule(self.multiworld.get_entrance("Depths -> Depths - After Sewer Chamber Key", self.player), lambda state: state.has("Sewer Chamber Key", self.player))
-        set_rule(self.multiworld.get_entrance("Depths -> Depths to Blighttown Door", self.player), lambda state: state.has("Blighttown Key", self.player))
-        set_rule(self.multiworld.get_entrance("Blighttown -> Depths to Blighttown Door", self.player), lambda state: state.has("Depths -> Blighttown opened", self.player))
-        set_rule(self.multiworld.get_entrance("Blighttown -> Demon Ruins", self.player), lambda state: state.has("Chaos Witch Quelaag Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("Blighttown -> The Great Hollow", self.player), lambda state: state.has("Lordvessel", self.player))
-        
-        set_rule(self.multiworld.get_location("UP: Bell of Awakening #1 rung", self.player), lambda state: state.has("Bell Gargoyles Defeated", self.player))
-        set_rule(self.multiworld.get_location("BT: Bell of Awakening #2 rung", self.player), lambda state: state.has("Chaos Witch Quelaag Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("Undead Parish -> Sen's Fortress", self.player), lambda state: state.has("Bell of Awakening #1", self.player) and state.has("Bell of Awakening #2", self.player))
-        set_rule(self.multiworld.get_entrance("Sen's Fortress -> Sen's Fortress - After Cage Key", self.player), lambda state: state.has("Cage Key", self.player))
-        set_rule(self.multiworld.get_entrance("Sen's Fortress -> Anor Londo", self.player), lambda state: state.has("Iron Golem Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("Anor Londo -> The Duke's Archives", self.player), lambda state: state.has("Lordvessel", self.player))
-        
-        
-        set_rule(self.multiworld.get_entrance("Upper New Londo Ruins -> New Londo Ruins Door to the Seal", self.player), lambda state: state.has("Ornstein and Smough Defeated", self.player) and state.has("Key to the Seal", self.player))
-        set_rule(self.multiworld.get_entrance("Valley of the Drakes -> Valley of the Drakes - After Defeating Four Kings", self.player), lambda state: state.has("Four Kings Defeated", self.player))
-                
-        set_rule(self.multiworld.get_entrance("The Duke's Archives -> The Duke's Archives Cell Door", self.player), lambda state: state.has("Archive Tower Cell Key", self.player))
-        set_rule(self.multiworld.get_entrance("The Duke's Archives - Getting out of Cell -> The Duke's Archives - After Archive Prison Extra Key", self.player), lambda state: state.has("Archive Prison Extra Key", self.player))
-        set_rule(self.multiworld.get_entrance("The Duke's Archives - After Archive Prison Extra Key -> The Duke's Archives - After Archive Tower Giant Door Key", self.player), lambda state: state.has("Archive Tower Giant Door Key", self.player))
-        set_rule(self.multiworld.get_entrance("The Duke's Archives - Getting out of Cell -> The Duke's Archives - Giant Cell", self.player), lambda state: state.has("Archive Tower Giant Cell Key", self.player))
-        set_rule(self.multiworld.get_entrance("The Duke's Archives -> The Duke's Archives - First Arena after Seath's Death", self.player), lambda state: state.has("Seath the Scaleless Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("Anor Londo -> Painted World of Ariamis", self.player), lambda state: state.has("Peculiar Doll", self.player))
-        set_rule(self.multiworld.get_entrance("Painted World of Ariamis -> Painted World of Ariamis - After Annex Key", self.player), lambda state: state.has("Annex Key", self.player))
-        set_rule(self.multiworld.get_entrance("Firelink Shrine -> The Catacombs", self.player), lambda state: state.has("Ornstein and Smough Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("Lower New Londo Ruins -> The Abyss", self.player), lambda state: state.has("Covenant of Artorias", self.player))
-        set_rule(self.multiworld.get_entrance("Demon Ruins -> Demon Ruins - Behind Golden Fog Wall", self.player), lambda state: state.has("Lordvessel", self.player))
-        set_rule(self.multiworld.get_entrance("Lost Izalith -> Demon Ruins Shortcut", self.player), lambda state: state.has("Bed of Chaos Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("Demon Ruins - Behind Golden Fog Wall -> Demon Ruins Shortcut", self.player), lambda state: state.has("Demon Ruins Shortcut opened", self.player))
-        set_rule(self.multiworld.get_entrance("Demon Ruins - Behind Golden Fog Wall -> Lost Izalith", self.player), lambda state: state.has("Orange Charred Ring", self.player) and state.has("Centipede Demon Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("The Catacombs - After Door 1 -> Tomb of the Giants", self.player), lambda state: state.has("Ornstein and Smough Defeated", self.player))
-        set_rule(self.multiworld.get_entrance("Tomb of the Giants -> Tomb of the Giants - Behind Golden Fog Wall", self.player), lambda state: state.has("Lordvessel", self.player))
-        set_rule(self.multiworld.get_entrance("Firelink Shrine -> Kiln of the First Flame", self.player), lambda state: state.has("Lord Soul (Bed of Chaos)", self.player) and state.has("Lord Soul (Nito)", self.player) and state.has("Bequeathed Lord Soul Shard (Four Kings)", self.player) and state.has("Bequeathed Lord Soul Shard (Seath)", self.player) and state.has("Lordvessel", self.player))
+                if location.address is None:
+                    continue
+                if location.item_rule is Location.item_rule:
+                    location.item_rule = item_rule
+                else:
+                    add_item_rule(location, item_rule)
         
-      
+        # Snuggly only hands out a trade for its item, one pass over the trade region instead of a lookup per trade
+        for location in self.multiworld.get_region("Northern Undead Asylum - Second Visit Snuggly Trades", self.player).locations:
+            required_item = snuggly_trades.get(location.name)
+            if required_item is not None:
+                set_rule(location, make_access_rule(DSRCompiledRequirement(frozenset((required_item,)), frozenset()), self.player))
         
-        #set_rule(self.multiworld.get_entrance("Darkroot Basin -> Sanctuary Garden", self.player), lambda state: state.has("Broken Pendant", self.player))
-        #set_rule(self.multiworld.get_entrance("Sanctuary Garden -> Oolacile Sanctuary", self.player), lambda state: state.has("Sanctuary Guardian Defeated", self.player))
-        #set_rule(self.multiworld.get_entrance("Royal Wood -> Oolacile Township", self.player), lambda state: state.has("Artorias the Abysswalker Defeated", self.player))
-        #set_rule(self.multiworld.get_entrance("Oolacile Township -> Oolacile Township - After Crest Key", self.player), lambda state: state.has("Crest Key", self.player))
+        for location_name, required_item in location_requirements.items():
+            set_rule(self.multiworld.get_location(location_name, self.player), make_access_rule(DSRCompiledRequirement(frozenset((required_item,)), frozenset()), self.player))
         
  
         
+    @classmethod
+    def stage_fill_slot_data(cls, multiworld: MultiWorld) -> None:
+        # Slot data buckets and sphere layouts of every DSR player, built in one pass each and handed to the worlds in
+        # player order. Archipelago has no stage call for fill_slot_data, the first DSR fill_slot_data (or spoiler)
+        # runs it; after fill, progression balancing can still move items, so it cannot run any earlier.
+        buckets = build_slot_data_buckets(multiworld, cls.game)
+        layouts = build_sphere_layouts(multiworld, cls.game)
+        for player in multiworld.get_game_players(cls.game):
+            world = multiworld.worlds[player]
+            world.slot_data_bucket = buckets[player]
+            world.sphere_layout = layouts[player]
+
+    def get_sphere_layout(self) -> List[List[DSRLocation]]:
+        # Shared by the spoiler and fill_slot_data
+        if self.sphere_layout is None:
+            self.stage_fill_slot_data(self.multiworld)
+        return self.sphere_layout
+
+    def write_spoiler(self, spoiler_handle: TextIO) -> None:
+        spoiler_handle.write(f"\n\nDark Souls Remastered local spheres (own items only) for {self.multiworld.player_name[self.player]}:\n")
+        for number, sphere in enumerate(self.get_sphere_layout(), 1):
+            spoiler_handle.write(f"\n  Sphere {number} ({len(sphere)} locations):\n")
+            for location in sphere:
+                spoiler_handle.write(f"    {location.name}: {location.item.name} ({self.multiworld.player_name[location.item.player]})\n")
+
     def fill_slot_data(self) -> Dict[str, object]:
-        slot_data: Dict[str, object] = {}
-        name_to_dsr_code = {item.name: item.dsr_code for item in item_dictionary.values()}
-        # Create the mandatory lists to generate the player's output file
-        items_id = []
-        items_address = []
-        locations_id = []
-        locations_address = []
-        locations_target = []
-        for location in self.multiworld.get_filled_locations():
-            if location.item.player == self.player:
-                #we are the receiver of the item
-                items_id.append(location.item.code)
-                items_address.append(name_to_dsr_code[location.item.name])
-
-
-            if location.player == self.player:
-                #we are the sender of the location check
-                locations_address.append(item_dictionary[location_dictionary[location.name].default_item].dsr_code)
-                locations_id.append(location.address)
-                if location.item.player == self.player:
-                    locations_target.append(name_to_dsr_code[location.item.name])
-                else:
-                    locations_target.append(0)
+        if self.slot_data_bucket is None:
+            self.stage_fill_slot_data(self.multiworld)
+        bucket = self.slot_data_bucket
 
         slot_data = {
             "options": {
@@ -460,11 +315,20 @@ class DSRWorld(World):
             "seed": self.multiworld.seed_name,  # to verify the server's multiworld
             "slot": self.multiworld.player_name[self.player],  # to connect to server
             "base_id": self.base_id,  # to merge location and items lists
-            "locationsId": locations_id,
-            "locationsAddress": locations_address,
-            "locationsTarget": locations_target,
-            "itemsId": items_id,
-            "itemsAddress": items_address
+            "sphereLocationCounts": [len(sphere) for sphere in self.get_sphere_layout()],  # local spheres, see Spheres.build_sphere_layout
+        }
+
+        arrays = {
+            "locationsId": bucket.locations_id,
+            "locationsAddress": bucket.locations_address,
+            "locationsTarget": bucket.locations_target,
+            "itemsId": bucket.items_id,
+            "itemsAddress": bucket.items_address
         }
+        if self.options.compact_slot_data.value:
+            # Packed arrays, see SlotData.encode_compact_array for the layout
+            slot_data["slotDataFormat"] = COMPACT_SLOT_DATA_FORMAT
+            arrays = {key: encode_compact_array(values) for key, values in arrays.items()}
+        slot_data.update(arrays)
 
         return slot_data
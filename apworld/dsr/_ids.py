@@ -0,0 +1,2121 @@
+# Generated from the tables in ItemTable.py and LocationTable.py, do not edit by hand.
+# Lets the world register its ids and item groups without building the full tables at import.
+
+item_name_to_id = {
+    "Asylum Demon Defeated": 11111000,
+    "Taurus Demon Defeated": 11111001,
+    "Bell Gargoyles Defeated": 11111002,
+    "Capra Demon Defeated": 11111003,
+    "Ceaseless Discharge Defeated": 11111004,
+    "Centipede Demon Defeated": 11111005,
+    "Chaos Witch Quelaag Defeated": 11111006,
+    "Crossbreed Priscilla Defeated": 11111007,
+    "Demon Firesage Defeated": 11111008,
+    "Ornstein and Smough Defeated": 11111009,
+    "Four Kings Defeated": 11111010,
+    "Gaping Dragon Defeated": 11111011,
+    "Gravelord Nito Defeated": 11111012,
+    "Great Grey Wolf Sif Defeated": 11111013,
+    "Gwyn, Lord of Cinder Defeated": 11111014,
+    "Iron Golem Defeated": 11111015,
+    "Moonlight Butterfly Defeated": 11111016,
+    "Pinwheel Defeated": 11111017,
+    "Seath the Scaleless Defeated": 11111018,
+    "Black Dragon Kalameet Defeated": 11111019,
+    "Bed of Chaos Defeated": 11111020,
+    "Manus, Father of the Abyss Defeated": 11111021,
+    "Artorias the Abysswalker Defeated": 11111022,
+    "Sanctuary Guardian Defeated": 11111023,
+    "Gwyndolin Defeated": 11111024,
+    "Stray Demon Defeated": 11111025,
+    "Firelink Shrine lit": 11111026,
+    "Undead Parish lit": 11111027,
+    "Depths lit": 11111028,
+    "Undead Burg - Sunlight Altar lit": 11111029,
+    "Quelaag's Domain lit": 11111030,
+    "Anor Londo lit": 11111031,
+    "Anor Londo Chamber of the Princess lit": 11111032,
+    "Undead Asylum - Courtyard lit": 11111033,
+    "Undead Asylum - Interior lit": 11111034,
+    "Undead Burg lit": 11111035,
+    "Darkroot Garden lit": 11111036,
+    "Darkroot Basin lit": 11111037,
+    "Blighttown Catwalk lit": 11111038,
+    "Blighttown Swamp lit": 11111039,
+    "The Great Hollow lit": 11111040,
+    "Ash Lake lit": 11111041,
+    "Ash Lake - Stone Dragon lit": 11111042,
+    "Demon Ruins - Entrance lit": 11111043,
+    "Demon Ruins - Staircase lit": 11111044,
+    "Demon Ruins - Catacombs lit": 11111045,
+    "Lost Izalith - Lava Pits lit": 11111046,
+    "Lost Izalith - Past Illusory Wall lit": 11111047,
+    "Lost Izalith - Heart of Chaos lit": 11111048,
+    "Sen's Fortress lit": 11111049,
+    "Anor Londo - Darkmoon Tomb lit": 11111050,
+    "Anor Londo - Residence lit": 11111051,
+    "Painted World lit": 11111052,
+    "Duke's Archives - Entrance lit": 11111053,
+    "Duke's Archives Cell lit": 11111054,
+    "Duke's Archives - Balcony lit": 11111055,
+    "Crystal Cave lit": 11111056,
+    "Catacombs - Necromancer Cave lit": 11111057,
+    "Catacombs - Vamos lit": 11111058,
+    "Catacombs - Past Illusory Wall lit": 11111059,
+    "Tomb of the Giants - Patches lit": 11111060,
+    "Tomb of the Giants lit": 11111061,
+    "Tomb of the Giants - Altar of the Gravelord lit": 11111062,
+    "The Abyss lit": 11111063,
+    "Oolacile - Sanctuary Garden lit": 11111064,
+    "Oolacile - Sanctuary lit": 11111065,
+    "Oolacile - Township Dungeon lit": 11111066,
+    "Chasm of the Abyss lit": 11111067,
+    "Depths Shortcut opened": 11111068,
+    "Depths -> Blighttown opened": 11111069,
+    "Depths Bonfire Room opened": 11111070,
+    "Undead Burg Female Merchant Shortcut opened": 11111071,
+    "Undead Burg -> Lower Undead Burg opened": 11111072,
+    "Undead Burg Basement opened": 11111073,
+    "Undead Burg Watchtower Upper opened": 11111074,
+    "Undead Burg Watchtower Lower opened": 11111075,
+    "Undead Burg Sunlight Altar opened": 11111076,
+    "Oolacile Crest Key Door opened": 11111077,
+    "Catacombs Door 1 opened": 11111078,
+    "Catacombs Door 2 opened": 11111079,
+    "Demon Ruins Shortcut opened": 11111080,
+    "Sen's Fortress Main Gate opened": 11111081,
+    "Anor Londo Main Hall Door opened": 11111082,
+    "Anor Londo Giant Blacksmith Shortcut opened": 11111083,
+    "Anor Londo Bonfire Shortcut opened": 11111084,
+    "New Londo Ruins Door to the Seal opened": 11111085,
+    "New Londo Ruins -> Valley of the Drakes opened": 11111086,
+    "Duke's Archives Bookshelf Door opened": 11111087,
+    "Duke's Archives Cell Door opened": 11111088,
+    "Undead Asylum Cell Door opened": 11111089,
+    "Undead Asylum F2 West Door opened": 11111090,
+    "Undead Asylum Shortcut Door opened": 11111091,
+    "Undead Asylum F2 East Door opened": 11111092,
+    "Undead Asylum Big Pilgrim Door opened": 11111093,
+    "Undead Asylum - Boss Door opened": 11111094,
+    "Oolacile - Township lit": 11111095,
+    "Bell of Awakening #1": 11111096,
+    "Bell of Awakening #2": 11111097,
+    "Eye of Death": 11112000,
+    "Cracked Red Eye Orb": 11112001,
+    "Elizabeth's Mushroom": 11112002,
+    "Divine Blessing": 11112003,
+    "Green Blossom": 11112004,
+    "Bloodred Moss Clump": 11112005,
+    "Purple Moss Clump": 11112006,
+    "Blooming Purple Moss Clump": 11112007,
+    "Purging Stone": 11112008,
+    "Egg Vermifuge": 11112009,
+    "Repair Powder": 11112010,
+    "Throwing Knife": 11112011,
+    "Poison Throwing Knife": 11112012,
+    "Firebomb": 11112013,
+    "Dung Pie": 11112014,
+    "Alluring Skull": 11112015,
+    "Lloyd's Talisman": 11112016,
+    "Black Firebomb": 11112017,
+    "Charcoal Pine Resin": 11112018,
+    "Gold Pine Resin": 11112019,
+    "Transient Curse": 11112020,
+    "Rotten Pine Resin": 11112021,
+    "Homeward Bone": 11112022,
+    "Prism Stone": 11112023,
+    "Indictment": 11112024,
+    "Souvenir of Reprisal": 11112025,
+    "Sunlight Medal": 11112026,
+    "Pendant": 11112027,
+    "Rubbish": 11112028,
+    "Copper Coin": 11112029,
+    "Silver Coin": 11112030,
+    "Gold Coin": 11112031,
+    "Fire Keeper Soul (Anastacia of Astora)": 11112032,
+    "Fire Keeper Soul (Darkmoon Knightess)": 11112033,
+    "Fire Keeper Soul (Daughter of Chaos)": 11112034,
+    "Fire Keeper Soul (New Londo)": 11112035,
+    "Fire Keeper Soul (Blighttown)": 11112036,
+    "Fire Keeper Soul (Duke's Archives)": 11112037,
+    "Fire Keeper Soul (Undead Parish)": 11112038,
+    "Soul of a Lost Undead": 11112039,
+    "Large Soul of a Lost Undead": 11112040,
+    "Soul of a Nameless Soldier": 11112041,
+    "Large Soul of a Nameless Soldier": 11112042,
+    "Soul of a Proud Knight": 11112043,
+    "Large Soul of a Proud Knight": 11112044,
+    "Soul of a Brave Warrior": 11112045,
+    "Large Soul of a Brave Warrior": 11112046,
+    "Soul of a Hero": 11112047,
+    "Soul of a Great Hero": 11112048,
+    "Humanity": 11112049,
+    "Twin Humanities": 11112050,
+    "Soul of Quelaag": 11112051,
+    "Soul of Sif": 11112052,
+    "Soul of Gwyn, Lord of Cinder": 11112053,
+    "Core of an Iron Golem": 11112054,
+    "Soul of Ornstein": 11112055,
+    "Soul of Moonlight Butterfly": 11112056,
+    "Soul of Smough": 11112057,
+    "Soul of Priscilla": 11112058,
+    "Soul of Gwyndolin": 11112059,
+    "Guardian Soul": 11112060,
+    "Soul of Artorias": 11112061,
+    "Soul of Manus": 11112062,
+    "White Sign Soapstone": 11112063,
+    "Red Sign Soapstone": 11112064,
+    "Red Eye Orb": 11112065,
+    "Black Separation Crystal": 11112066,
+    "Orange Guidance Soapstone": 11112067,
+    "Book of the Guilty": 11112068,
+    "Servant Roster": 11112069,
+    "Blue Eye Orb": 11112070,
+    "Dragon Eye": 11112071,
+    "Black Eye Orb": 11112072,
+    "Darksign": 11112073,
+    "Purple Coward's Crystal": 11112074,
+    "Silver Pendant": 11112075,
+    "Dried Finger": 11112076,
+    "Carving: HELLO!": 11112077,
+    "Carving: THANK YOU!": 11112078,
+    "Carving: VERY GOOD!": 11112079,
+    "Carving: I'M SORRY!": 11112080,
+    "Carving: HELP ME!": 11112081,
+    "Binoculars": 11112082,
+    "Dragon Head Stone": 11112083,
+    "Dragon Torso Stone": 11112084,
+    "Peculiar Doll": 11113000,
+    "Basement Key": 11113001,
+    "Crest of Artorias": 11113002,
+    "Cage Key": 11113003,
+    "Archive Tower Cell Key": 11113004,
+    "Archive Tower Giant Door Key": 11113005,
+    "Archive Tower Giant Cell Key": 11113006,
+    "Blighttown Key": 11113007,
+    "Key to New Londo Ruins": 11113008,
+    "Annex Key": 11113009,
+    "Dungeon Cell Key": 11113010,
+    "Big Pilgrim's Key": 11113011,
+    "Undead Asylum F2 East Key": 11113012,
+    "Key to the Seal": 11113013,
+    "Key to Depths": 11113014,
+    "Undead Asylum F2 West Key": 11113015,
+    "Mystery Key": 11113016,
+    "Sewer Chamber Key": 11113017,
+    "Watchtower Basement Key": 11113018,
+    "Archive Prison Extra Key": 11113019,
+    "Residence Key": 11113020,
+    "Crest Key": 11113021,
+    "Master Key": 11113022,
+    "Lord Soul (Nito)": 11113023,
+    "Lord Soul (Bed of Chaos)": 11113024,
+    "Bequeathed Lord Soul Shard (Four Kings)": 11113025,
+    "Bequeathed Lord Soul Shard (Seath)": 11113026,
+    "Lordvessel": 11113027,
+    "Broken Pendant": 11113028,
+    "Weapon Smithbox": 11113029,
+    "Armor Smithbox": 11113030,
+    "Repairbox": 11113031,
+    "Rite of Kindling": 11113032,
+    "Bottomless Box": 11113033,
+    "Estus Flask": 11113034,
+    "Havel's Ring": 11114000,
+    "Red Tearstone Ring": 11114001,
+    "Darkmoon Blade Covenant Ring": 11114002,
+    "Cat Covenant Ring": 11114003,
+    "Cloranthy Ring": 11114004,
+    "Flame Stoneplate Ring": 11114005,
+    "Thunder Stoneplate Ring": 11114006,
+    "Spell Stoneplate Ring": 11114007,
+    "Speckled Stoneplate Ring": 11114008,
+    "Bloodbite Ring": 11114009,
+    "Poisonbite Ring": 11114010,
+    "Tiny Being's Ring": 11114011,
+    "Cursebite Ring": 11114012,
+    "White Seance Ring": 11114013,
+    "Bellowing Dragoncrest Ring": 11114014,
+    "Dusk Crown Ring": 11114015,
+    "Hornet Ring": 11114016,
+    "Hawk Ring": 11114017,
+    "Ring of Steel Protection": 11114018,
+    "Covetous Gold Serpent Ring": 11114019,
+    "Covetous Silver Serpent Ring": 11114020,
+    "Slumbering Dragoncrest Ring": 11114021,
+    "Ring of Fog": 11114022,
+    "Rusted Iron Ring": 11114023,
+    "Ring of Sacrifice": 11114024,
+    "Rare Ring of Sacrifice": 11114025,
+    "Dark Wood Grain Ring": 11114026,
+    "Ring of the Sun Princess": 11114027,
+    "Old Witch's Ring": 11114028,
+    "Covenant of Artorias": 11114029,
+    "Orange Charred Ring": 11114030,
+    "Lingering Dragoncrest Ring": 11114031,
+    "Ring of the Evil Eye": 11114032,
+    "Ring of Favor and Protection": 11114033,
+    "Leo Ring": 11114034,
+    "East Wood Grain Ring": 11114035,
+    "Wolf Ring": 11114036,
+    "Blue Tearstone Ring": 11114037,
+    "Ring of the Sun's Firstborn": 11114038,
+    "Darkmoon Seance Ring": 11114039,
+    "Calamity Ring": 11114040,
+    "Large Ember": 11115000,
+    "Very Large Ember": 11115001,
+    "Crystal Ember": 11115002,
+    "Large Magic Ember": 11115003,
+    "Enchanted Ember": 11115004,
+    "Divine Ember": 11115005,
+    "Large Divine Ember": 11115006,
+    "Dark Ember": 11115007,
+    "Large Flame Ember": 11115008,
+    "Chaos Flame Ember": 11115009,
+    "Titanite Shard": 11115010,
+    "Large Titanite Shard": 11115011,
+    "Green Titanite Shard": 11115012,
+    "Titanite Chunk": 11115013,
+    "Blue Titanite Chunk": 11115014,
+    "White Titanite Chunk": 11115015,
+    "Red Titanite Chunk": 11115016,
+    "Titanite Slab": 11115017,
+    "Blue Titanite Slab": 11115018,
+    "White Titanite Slab": 11115019,
+    "Red Titanite Slab": 11115020,
+    "Dragon Scale": 11115021,
+    "Demon Titanite": 11115022,
+    "Twinkling Titanite": 11115023,
+    "Sorcery: Soul Arrow": 11116000,
+    "Sorcery: Great Soul Arrow": 11116001,
+    "Sorcery: Heavy Soul Arrow": 11116002,
+    "Sorcery: Great Heavy Soul Arrow": 11116003,
+    "Sorcery: Homing Soulmass": 11116004,
+    "Sorcery: Homing Crystal Soulmass": 11116005,
+    "Sorcery: Soul Spear": 11116006,
+    "Sorcery: Crystal Soul Spear": 11116007,
+    "Sorcery: Magic Weapon": 11116008,
+    "Sorcery: Great Magic Weapon": 11116009,
+    "Sorcery: Crystal Magic Weapon": 11116010,
+    "Sorcery: Magic Shield": 11116011,
+    "Sorcery: Strong Magic Shield": 11116012,
+    "Sorcery: Hidden Weapon": 11116013,
+    "Sorcery: Hidden Body": 11116014,
+    "Sorcery: Cast Light": 11116015,
+    "Sorcery: Hush": 11116016,
+    "Sorcery: Aural Decoy": 11116017,
+    "Sorcery: Repair": 11116018,
+    "Sorcery: Fall Control": 11116019,
+    "Sorcery: Chameleon": 11116020,
+    "Sorcery: Resist Curse": 11116021,
+    "Sorcery: Remedy": 11116022,
+    "Sorcery: White Dragon Breath": 11116023,
+    "Sorcery: Dark Orb": 11116024,
+    "Sorcery: Dark Bead": 11116025,
+    "Sorcery: Dark Fog": 11116026,
+    "Sorcery: Pursuers": 11116027,
+    "Pyromancy: Fireball": 11116028,
+    "Pyromancy: Fire Orb": 11116029,
+    "Pyromancy: Great Fireball": 11116030,
+    "Pyromancy: Firestorm": 11116031,
+    "Pyromancy: Fire Tempest": 11116032,
+    "Pyromancy: Fire Surge": 11116033,
+    "Pyromancy: Fire Whip": 11116034,
+    "Pyromancy: Combustion": 11116035,
+    "Pyromancy: Great Combustion": 11116036,
+    "Pyromancy: Poison Mist": 11116037,
+    "Pyromancy: Toxic Mist": 11116038,
+    "Pyromancy: Acid Surge": 11116039,
+    "Pyromancy: Iron Flesh": 11116040,
+    "Pyromancy: Flash Sweat": 11116041,
+    "Pyromancy: Undead Rapport": 11116042,
+    "Pyromancy: Power Within": 11116043,
+    "Pyromancy: Great Chaos Fireball": 11116044,
+    "Pyromancy: Chaos Storm": 11116045,
+    "Pyromancy: Chaos Fire Whip": 11116046,
+    "Pyromancy: Black Flame": 11116047,
+    "Miracle: Heal": 11116048,
+    "Miracle: Great Heal": 11116049,
+    "Miracle: Great Heal Excerpt": 11116050,
+    "Miracle: Soothing Sunlight": 11116051,
+    "Miracle: Replenishment": 11116052,
+    "Miracle: Bountiful Sunlight": 11116053,
+    "Miracle: Gravelord Sword Dance": 11116054,
+    "Miracle: Gravelord Greatsword Dance": 11116055,
+    "Miracle: Escape Death": 11116056,
+    "Miracle: Homeward": 11116057,
+    "Miracle: Force": 11116058,
+    "Miracle: Wrath of the Gods": 11116059,
+    "Miracle: Emit Force": 11116060,
+    "Miracle: Seek Guidance": 11116061,
+    "Miracle: Lightning Spear": 11116062,
+    "Miracle: Great Lightning Spear": 11116063,
+    "Miracle: Sunlight Spear": 11116064,
+    "Miracle: Magic Barrier": 11116065,
+    "Miracle: Great Magic Barrier": 11116066,
+    "Miracle: Karmic Justice": 11116067,
+    "Miracle: Tranquil Walk of Peace": 11116068,
+    "Miracle: Vow of Silence": 11116069,
+    "Miracle: Sunlight Blade": 11116070,
+    "Miracle: Darkmoon Blade": 11116071,
+    "Catarina Helm": 11117000,
+    "Catarina Armor": 11117001,
+    "Catarina Gauntlets": 11117002,
+    "Catarina Leggings": 11117003,
+    "Paladin Helm": 11117004,
+    "Paladin Armor": 11117005,
+    "Paladin Gauntlets": 11117006,
+    "Paladin Leggings": 11117007,
+    "Dark Mask": 11117008,
+    "Dark Armor": 11117009,
+    "Dark Gauntlets": 11117010,
+    "Dark Leggings": 11117011,
+    "Brigand Hood": 11117012,
+    "Brigand Armor": 11117013,
+    "Brigand Gauntlets": 11117014,
+    "Brigand Trousers": 11117015,
+    "Shadow Mask": 11117016,
+    "Shadow Garb": 11117017,
+    "Shadow Gauntlets": 11117018,
+    "Shadow Leggings": 11117019,
+    "Black Iron Helm": 11117020,
+    "Black Iron Armor": 11117021,
+    "Black Iron Gauntlets": 11117022,
+    "Black Iron Leggings": 11117023,
+    "Smough's Helm": 11117024,
+    "Smough's Armor": 11117025,
+    "Smough's Gauntlets": 11117026,
+    "Smough's Leggings": 11117027,
+    "Six-Eyed Helm of the Channelers": 11117028,
+    "Robe of the Channelers": 11117029,
+    "Gauntlets of the Channelers": 11117030,
+    "Waistcloth of the Channelers": 11117031,
+    "Helm of Favor": 11117032,
+    "Embraced Armor of Favor": 11117033,
+    "Gauntlets of Favor": 11117034,
+    "Leggings of Favor": 11117035,
+    "Helm of the Wise": 11117036,
+    "Armor of the Glorious": 11117037,
+    "Gauntlets of the Vanquisher": 11117038,
+    "Boots of the Explorer": 11117039,
+    "Stone Helm": 11117040,
+    "Stone Armor": 11117041,
+    "Stone Gauntlets": 11117042,
+    "Stone Leggings": 11117043,
+    "Crystalline Helm": 11117044,
+    "Crystalline Armor": 11117045,
+    "Crystalline Gauntlets": 11117046,
+    "Crystalline Leggings": 11117047,
+    "Mask of the Sealer": 11117048,
+    "Crimson Robe": 11117049,
+    "Crimson Gloves": 11117050,
+    "Crimson Waistcloth": 11117051,
+    "Mask of Velka": 11117052,
+    "Black Cleric Robe": 11117053,
+    "Black Manchette": 11117054,
+    "Black Tights": 11117055,
+    "Iron Helm": 11117056,
+    "Armor of the Sun": 11117057,
+    "Iron Bracelet": 11117058,
+    "Iron Leggings": 11117059,
+    "Chain Helm": 11117060,
+    "Chain Armor": 11117061,
+    "Leather Gauntlets": 11117062,
+    "Chain Leggings": 11117063,
+    "Cleric Helm": 11117064,
+    "Cleric Armor": 11117065,
+    "Cleric Gauntlets": 11117066,
+    "Cleric Leggings": 11117067,
+    "Sunlight Maggot": 11117068,
+    "Helm of Thorns": 11117069,
+    "Armor of Thorns": 11117070,
+    "Gauntlets of Thorns": 11117071,
+    "Leggings of Thorns": 11117072,
+    "Standard Helm": 11117073,
+    "Hard Leather Armor": 11117074,
+    "Hard Leather Gauntlets": 11117075,
+    "Hard Leather Boots": 11117076,
+    "Sorcerer Hat": 11117077,
+    "Sorcerer Cloak": 11117078,
+    "Sorcerer Gauntlets": 11117079,
+    "Sorcerer Boots": 11117080,
+    "Tattered Cloth Hood": 11117081,
+    "Tattered Cloth Robe": 11117082,
+    "Tattered Cloth Machette": 11117083,
+    "Heavy Boots": 11117084,
+    "Pharis's Hat": 11117085,
+    "Leather Armor": 11117086,
+    "Leather Gloves": 11117087,
+    "Leather Boots": 11117088,
+    "Painting Guardian Hood": 11117089,
+    "Painting Guardian Robe": 11117090,
+    "Painting Guardian Gloves": 11117091,
+    "Painting Guardian Waistcloth": 11117092,
+    "Ornstein's Helm": 11117093,
+    "Ornstein's Armor": 11117094,
+    "Ornstein's Gauntlets": 11117095,
+    "Ornstein's Leggings": 11117096,
+    "Eastern Helm": 11117097,
+    "Eastern Armor": 11117098,
+    "Eastern Gauntlets": 11117099,
+    "Eastern Leggings": 11117100,
+    "Xanthous Crown": 11117101,
+    "Xanthous Overcoat": 11117102,
+    "Xanthous Gloves": 11117103,
+    "Xanthous Waistcloth": 11117104,
+    "Thief Mask": 11117105,
+    "Black Leather Armor": 11117106,
+    "Black Leather Gloves": 11117107,
+    "Black Leather Boots": 11117108,
+    "Priest's Hat": 11117109,
+    "Holy Robe": 11117110,
+    "Traveling Gloves": 11117111,
+    "Holy Trousers": 11117112,
+    "Black Knight Helm": 11117113,
+    "Black Knight Armor": 11117114,
+    "Black Knight Gauntlets": 11117115,
+    "Black Knight Leggings": 11117116,
+    "Crown of Dusk": 11117117,
+    "Antiquated Dress": 11117118,
+    "Antiquated Gloves": 11117119,
+    "Antiquated Skirt": 11117120,
+    "Witch Hat": 11117121,
+    "Witch Cloak": 11117122,
+    "Witch Gloves": 11117123,
+    "Witch Skirt": 11117124,
+    "Elite Knight Helm": 11117125,
+    "Elite Knight Armor": 11117126,
+    "Elite Knight Gauntlets": 11117127,
+    "Elite Knight Leggings": 11117128,
+    "Wanderer Hood": 11117129,
+    "Wanderer Coat": 11117130,
+    "Wanderer Manchette": 11117131,
+    "Wanderer Boots": 11117132,
+    "Big Hat": 11117138,
+    "Sage Robe": 11117139,
+    "Traveling Boots": 11117141,
+    "Knight Helm": 11117142,
+    "Knight Armor": 11117143,
+    "Knight Gauntlets": 11117144,
+    "Knight Leggings": 11117145,
+    "Dingy Hood": 11117146,
+    "Dingy Robe": 11117147,
+    "Dingy Gloves": 11117148,
+    "Blood-Stained Skirt": 11117149,
+    "Maiden Hood": 11117150,
+    "Maiden Robe": 11117151,
+    "Maiden Gloves": 11117152,
+    "Maiden Skirt": 11117153,
+    "Silver Knight Helm": 11117154,
+    "Silver Knight Armor": 11117155,
+    "Silver Knight Gauntlets": 11117156,
+    "Silver Knight Leggings": 11117157,
+    "Havel's Helm": 11117158,
+    "Havel's Armor": 11117159,
+    "Havel's Gauntlets": 11117160,
+    "Havel's Leggings": 11117161,
+    "Brass Helm": 11117162,
+    "Brass Armor": 11117163,
+    "Brass Gauntlets": 11117164,
+    "Brass Leggings": 11117165,
+    "Gold-Hemmed Black Hood": 11117166,
+    "Gold-Hemmed Black Cloak": 11117167,
+    "Gold-Hemmed Black Gloves": 11117168,
+    "Gold-Hemmed Black Skirt": 11117169,
+    "Golem Helm": 11117170,
+    "Golem Armor": 11117171,
+    "Golem Gauntlets": 11117172,
+    "Golem Leggings": 11117173,
+    "Hollow Soldier Helm": 11117174,
+    "Hollow Soldier Armor": 11117175,
+    "Hollow Soldier Waistcloth": 11117176,
+    "Steel Helm": 11117177,
+    "Steel Armor": 11117178,
+    "Steel Gauntlets": 11117179,
+    "Steel Leggings": 11117180,
+    "Hollow Thief's Hood": 11117181,
+    "Hollow Thief's Leather Armor": 11117182,
+    "Hollow Thief's Tights": 11117183,
+    "Balder Helm": 11117184,
+    "Balder Armor": 11117185,
+    "Balder Gauntlets": 11117186,
+    "Balder Leggings": 11117187,
+    "Hollow Warrior Helm": 11117188,
+    "Hollow Warrior Armor": 11117189,
+    "Hollow Warrior Waistcloth": 11117190,
+    "Giant Helm": 11117191,
+    "Giant Armor": 11117192,
+    "Giant Gauntlets": 11117193,
+    "Giant Leggings": 11117194,
+    "Crown of the Dark Sun": 11117195,
+    "Moonlight Robe": 11117196,
+    "Moonlight Gloves": 11117197,
+    "Moonlight Waistcloth": 11117198,
+    "Crown of the Great Lord": 11117199,
+    "Robe of the Great Lord": 11117200,
+    "Bracelet of the Great Lord": 11117201,
+    "Anklet of the Great Lord": 11117202,
+    "Sack": 11117203,
+    "Symbol of Avarice": 11117204,
+    "Royal Helm": 11117205,
+    "Mask of the Father": 11117206,
+    "Mask of the Mother": 11117207,
+    "Mask of the Child": 11117208,
+    "Fang Boar Helm": 11117209,
+    "Gargoyle Helm": 11117210,
+    "Black Sorcerer Hat": 11117211,
+    "Black Sorcerer Cloak": 11117212,
+    "Black Sorcerer Gauntlets": 11117213,
+    "Black Sorcerer Boots": 11117214,
+    "Elite Cleric Helm": 11117215,
+    "Elite Cleric Armor": 11117216,
+    "Elite Cleric Gauntlets": 11117217,
+    "Elite Cleric Leggings": 11117218,
+    "Helm of Artorias": 11117219,
+    "Armor of Artorias": 11117220,
+    "Gauntlets of Artorias": 11117221,
+    "Leggings of Artorias": 11117222,
+    "Porcelain Mask": 11117223,
+    "Lord's Blade Robe": 11117224,
+    "Lord's Blade Gloves": 11117225,
+    "Lord's Blade Waistcloth": 11117226,
+    "Gough's Helm": 11117227,
+    "Gough's Armor": 11117228,
+    "Gough's Gauntlets": 11117229,
+    "Gough's Leggings": 11117230,
+    "Guardian Helm": 11117231,
+    "Guardian Armor": 11117232,
+    "Guardian Gauntlets": 11117233,
+    "Guardian Leggings": 11117234,
+    "Snickering Top Hat": 11117235,
+    "Chester's Long Coat": 11117236,
+    "Chester's Gloves": 11117237,
+    "Chester's Trousers": 11117238,
+    "Bloated Head": 11117239,
+    "Bloated Sorcerer Head": 11117240,
+    "Dagger": 11118000,
+    "Parrying Dagger": 11118001,
+    "Ghost Blade": 11118002,
+    "Bandit's Knife": 11118003,
+    "Priscilla's Dagger": 11118004,
+    "Shortsword": 11118005,
+    "Longsword": 11118006,
+    "BroadSword": 11118007,
+    "Broken Straight Sword": 11118008,
+    "Balder Side Sword": 11118009,
+    "Crystal Straight Sword": 11118010,
+    "Sunlight Straight Sword": 11118123,
+    "Barbed Straight Sword": 11118011,
+    "Silver Knight Straight Sword": 11118012,
+    "Astora's Straight Sword": 11118013,
+    "Darksword": 11118014,
+    "Drake Sword": 11118015,
+    "Straight Sword Hilt": 11118016,
+    "Bastard Sword": 11118017,
+    "Claymore": 11118018,
+    "Man-Serpent Greatsword": 11118019,
+    "Flamberge": 11118020,
+    "Crystal Greatsword": 11118021,
+    "Stone Greatsword": 11118022,
+    "Greatsword of Artorias": 11118023,
+    "Moonlight Greatsword": 11118024,
+    "Black Knight Sword": 11118025,
+    "Greatsword of Artorias (Cursed)": 11118124,
+    "Great Lord Greatsword": 11118026,
+    "Zweihander": 11118027,
+    "Greatsword": 11118028,
+    "Demon Great Machete": 11118029,
+    "Dragon Greatsword": 11118030,
+    "Black Knight Greatsword": 11118031,
+    "Scimitar": 11118032,
+    "Falchion": 11118033,
+    "Shotel": 11118034,
+    "Jagged Ghost Blade": 11118035,
+    "Painting Guardian Sword": 11118036,
+    "Quelaag's Furysword": 11118037,
+    "Server": 11118038,
+    "Murakumo": 11118039,
+    "Gravelord Sword": 11118040,
+    "Uchigatana": 11118041,
+    "Washing Pole": 11118042,
+    "Iaito": 11118043,
+    "Chaos Blade": 11118044,
+    "Mail Breaker": 11118045,
+    "Rapier": 11118046,
+    "Estoc": 11118047,
+    "Velka's Rapier": 11118048,
+    "Ricard's Rapier": 11118049,
+    "Hand Axe": 11118050,
+    "Battle Axe": 11118051,
+    "Crescent Axe": 11118052,
+    "Butcher Knife": 11118053,
+    "Golem Axe": 11118054,
+    "Gargoyle Tail Axe": 11118055,
+    "Greataxe": 11118056,
+    "Demon's Greataxe": 11118057,
+    "Dragon King Greataxe": 11118125,
+    "Black Knight Greataxe": 11118126,
+    "Club": 11118058,
+    "Mace": 11118059,
+    "Morning Star": 11118060,
+    "Warpick": 11118061,
+    "Pickaxe": 11118062,
+    "Reinforced Club": 11118063,
+    "Blacksmith Hammer": 11118064,
+    "Blacksmith Giant Hammer": 11118127,
+    "Hammer of Vamos": 11118065,
+    "Great Club": 11118066,
+    "Grant": 11118067,
+    "Demon's Great Hammer": 11118068,
+    "Dragon Tooth": 11118069,
+    "Large Club": 11118070,
+    "Smough's Hammer": 11118071,
+    "Caestus": 11118072,
+    "Claw": 11118073,
+    "Dragon Bone Fist": 11118074,
+    "Dark Hand": 11118075,
+    "Spear": 11118076,
+    "Winged Spear": 11118077,
+    "Partizan": 11118078,
+    "Demon's Spear": 11118079,
+    "Channeler's Trident": 11118080,
+    "Silver Knight Spear": 11118081,
+    "Pike": 11118082,
+    "Dragonslayer Spear": 11118083,
+    "Moonlight Butterfly Horn": 11118084,
+    "Halberd": 11118085,
+    "Giant's Halberd": 11118086,
+    "Titanite Catch Pole": 11118087,
+    "Gargoyles's Halberd": 11118088,
+    "Black Knight Halberd": 11118089,
+    "Lucerne": 11118090,
+    "Scythe": 11118091,
+    "Great Scythe": 11118092,
+    "Lifehunt Scythe": 11118093,
+    "Whip": 11118094,
+    "Notched Whip": 11118095,
+    "Gold Tracer": 11118128,
+    "Dark Silver Tracer": 11118129,
+    "Abyss Greatsword": 11118130,
+    "Stone Greataxe": 11118131,
+    "Four-pronged Plow": 11118132,
+    "Guardian Tail": 11118133,
+    "Obsidian Greatsword": 11118134,
+    "Short Bow": 11118096,
+    "Longbow": 11118097,
+    "Black Bow of Pharis": 11118098,
+    "Dragonslayer Greatbow": 11118099,
+    "Composite Bow": 11118100,
+    "Darkmoon Bow": 11118101,
+    "Light Crossbow": 11118102,
+    "Heavy Crossbow": 11118103,
+    "Avelyn": 11118104,
+    "Sniper Crossbow": 11118105,
+    "Gough's Greatbow": 11118135,
+    "Standard Arrow": 11118136,
+    "Large Arrow": 11118137,
+    "Feather Arrow": 11118138,
+    "Fire Arrow": 11118139,
+    "Poison Arrow": 11118140,
+    "Moonlight Arrow": 11118141,
+    "Wooden Arrow": 11118142,
+    "Dragonslayer Arrow": 11118143,
+    "Gough's Great Arrow": 11118144,
+    "Standard Bolt": 11118145,
+    "Heavy Bolt": 11118146,
+    "Sniper Bolt": 11118147,
+    "Wood Bolt": 11118148,
+    "Lightning Bolt": 11118149,
+    "Sorcerer's Catalyst": 11118106,
+    "Beatrice's Catalyst": 11118107,
+    "Tin Banishment Catalyst": 11118108,
+    "Logan's Catalyst": 11118109,
+    "Tin Darkmoon Catalyst": 11118110,
+    "Oolacile Ivory Catalyst": 11118111,
+    "Tin Crystallization Catalyst": 11118112,
+    "Demon's Catalyst": 11118113,
+    "Izalith Catalyst": 11118114,
+    "Pyromancy Flame": 11118115,
+    "Pyromancy Flame (Ascended)": 11118150,
+    "Talisman": 11118116,
+    "Canvas Talisman": 11118117,
+    "Thorolund Talisman": 11118118,
+    "Ivory Talisman": 11118119,
+    "Sunlight Talisman": 11118120,
+    "Darkmoon Talisman": 11118121,
+    "Velka's Talisman": 11118122,
+    "Manus Catalyst": 11118151,
+    "Oolacile Catalyst": 11118152,
+    "Skull Lantern": 11119000,
+    "East-West Shield": 11119001,
+    "Wooden Shield": 11119002,
+    "Large Leather Shield": 11119003,
+    "Small Leather Shield": 11119004,
+    "Target Shield": 11119005,
+    "Buckler": 11119006,
+    "Cracked Round Shield": 11119007,
+    "Leather Shield": 11119008,
+    "Plank Shield": 11119009,
+    "Caduceus Round Shield": 11119010,
+    "Crystal Ring Shield": 11119011,
+    "Heater Shield": 11119012,
+    "Knight Shield": 11119013,
+    "Tower Kite Shield": 11119014,
+    "Grass Crest Shield": 11119015,
+    "Hollow Soldier Shield": 11119016,
+    "Balder Shield": 11119017,
+    "Crest Shield": 11119018,
+    "Dragon Crest Shield": 11119019,
+    "Warrior's Round Shield": 11119020,
+    "Iron Round Shield": 11119021,
+    "Spider Shield": 11119022,
+    "Spiked Shield": 11119023,
+    "Crystal Shield": 11119024,
+    "Sunlight Shield": 11119025,
+    "Silver Knight Shield": 11119026,
+    "Black Knight Shield": 11119027,
+    "Pierce Shield": 11119028,
+    "Red and White Round Shield": 11119029,
+    "Caduceus Kite Shield": 11119030,
+    "Gargoyle's Shield": 11119031,
+    "Eagle Shield": 11119032,
+    "Tower Shield": 11119033,
+    "Giant Shield": 11119034,
+    "Stone Greatshield": 11119035,
+    "Havel's Greatshield": 11119036,
+    "Bonewheel Shield": 11119037,
+    "Greatshield of Artorias": 11119038,
+    "Effigy Shield": 11119039,
+    "Sanctus": 11119040,
+    "Bloodshield": 11119041,
+    "Black Iron Greatshield": 11119042,
+    "Cleansing Greatshield": 11119043,
+    "Lag Trap": 11120000,
+}
+
+location_name_to_id = {
+    "UA: Dungeon Cell Key": 11110000,
+    "UA: Undead Asylum Cell Door opened": 11110001,
+    "UA: Undead Asylum F2 East Door opened": 11110008,
+    "UA: Undead Asylum - Courtyard lit": 11110002,
+    "UA: Undead Asylum - Boss Door opened": 11110003,
+    "UA: Undead Asylum - Interior lit": 11110005,
+    "UA: Estus Flask": 11110006,
+    "UA: Undead Asylum F2 East Key": 11110007,
+    "UA: Undead Asylum Shortcut Door opened": 11110554,
+    "UA: Asylum Demon Defeated": 11110009,
+    "UA: Big Pilgrim's Key": 11110010,
+    "UA: Soul of a Lost Undead - Outside Asylum": 11110012,
+    "UA: Undead Asylum Big Pilgrim Door opened": 11110011,
+    "FS: Firelink Shrine lit": 11110013,
+    "FS: Firebomb - Outside Petrus": 11110014,
+    "FS: Humanity - Firelink Well": 11110015,
+    "FS: Soul of a Lost Undead - Outside Firelink Elevator": 11110016,
+    "FS: Cracked Red Eye Orb - Firelink Elevator Drop": 11110017,
+    "FS: Morning Star": 11110018,
+    "FS: Talisman": 11110019,
+    "FS: Homeward Bone - Firelink Elevator Drop": 11110020,
+    "FS: Lloyd's Talisman": 11110021,
+    "FS: Soul of a Lost Undead - Outside Frampt": 11110022,
+    "FS: Soul of a Lost Undead - Above Frampt": 11110023,
+    "FS: Large Soul of a Lost Undead - Graveyard 1": 11110024,
+    "FS: Large Soul of a Lost Undead - Graveyard 2": 11110025,
+    "FS: Zweihander": 11110026,
+    "FS: Winged Spear": 11110027,
+    "FS: Caduceus Round Shield": 11110028,
+    "FS: Binoculars": 11110029,
+    "FS: Ring of Sacrifice - Jump onto Aqueduct": 11110030,
+    "FS: Soul of a Lost Undead - Aqueduct Cliff": 11110031,
+    "FS: Soul of a Lost Undead - Aqueduct Entrance": 11110032,
+    "FS: Soul of a Lost Undead - Sewer Rat": 11110033,
+    "UB: Soul of a Lost Undead - Window Corpse": 11110568,
+    "UB: Large Soul of a Lost Undead - Barrel Drop": 11110034,
+    "UB: Rubbish - Undead Burg": 11110035,
+    "UB: Humanity - Undead Burg Entrance Wall": 11110036,
+    "UB: Soul of a Lost Undead - Upper Burg Fogwall House": 11110037,
+    "UB: Wooden Shield": 11110038,
+    "UB: Undead Burg lit": 11110039,
+    "UB: Uchigatana": 11110040,
+    "UB: Throwing Knife": 11110043,
+    "UB: Light Crossbow": 11110044,
+    "UB: Standard Bolt": 11110617,
+    "UB: Black Firebomb - Side House Chest": 11110045,
+    "UB: Soul of a Lost Undead - Firebomb Throwers": 11110046,
+    "UB: Blue Tearstone Ring": 11110048,
+    "UB: Taurus Demon Defeated": 11110053,
+    "UB: Large Soul of a Lost Undead - After Taurus": 11110054,
+    "UB: White Sign Soapstone": 11110055,
+    "UB: Claymore": 11110056,
+    "UB: Soul of a Nameless Soldier - Hellkite Bridge": 11110057,
+    "UB: Undead Burg - Sunlight Altar lit": 11110058,
+    "UB: Undead Burg Sunlight Altar opened": 11110059,
+    "UB: Gold Pine Resin - 3x Gold Pine Resin in Chest behind Locked Door": 11110060,
+    "UP: Alluring Skull": 11110062,
+    "UP: Mystery Key": 11110063,
+    "UP: Large Soul of a Lost Undead - Hollow Room Rafters": 11110064,
+    "UP: Knight Shield": 11110065,
+    "UP: Undead Parish lit": 11110066,
+    "UP: Halberd": 11110067,
+    "UP: Basement Key": 11110068,
+    "UP: Fire Keeper Soul - Undead Parish": 11110070,
+    "UP: Large Soul of a Nameless Soldier - Parish Window": 11110071,
+    "UP: Humanity - Parish Barrel": 11110072,
+    "UP: Bell Gargoyles Defeated": 11110073,
+    "UP: Bell of Awakening #1 rung": 11110074,
+    "FS: Undead Asylum F2 West Key": 11110075,
+    "UA2: Undead Asylum F2 West Door opened": 11110076,
+    "UA2: Crest Shield": 11110077,
+    "UA2: Peculiar Doll": 11110079,
+    "UA2: Stray Demon Defeated": 11110080,
+    "Snuggly: Pendant -> Souvenir of Reprisal": 11110081,
+    "Snuggly: Rubbish -> Titanite Chunk": 11110082,
+    "Snuggly: Sunlight Medal -> White Titanite Chunk": 11110083,
+    "Snuggly: Bloodred Moss Clump -> Twinkling Titanite": 11110084,
+    "Snuggly: Purple Moss Clump -> Twinkling Titanite": 11110085,
+    "Snuggly: Blooming Purple Moss Clump -> Twinkling Titanite x2": 11110086,
+    "Snuggly: Cracked Red Eye Orb -> Purging Stone x2": 11110087,
+    "Snuggly: Humanity -> Ring of Sacrifice": 11110088,
+    "Snuggly: Twin Humanities -> Rare Ring of Sacrifice": 11110089,
+    "Snuggly: Prism Stone -> Demon Titanite": 11110090,
+    "Snuggly: Dung Pie -> Demon Titanite": 11110091,
+    "Snuggly: Pyromancy Flame -> Red Titanite Chunk": 11110092,
+    "Snuggly: Pyromancy Flame (Ascended) -> Red Titanite Slab": 11110093,
+    "Snuggly: Egg Vermifuge -> Dragon Scale": 11110094,
+    "Snuggly: Sunlight Maggot -> Old Witch's Ring": 11110095,
+    "Snuggly: Sack -> Demon's Great Hammer": 11110096,
+    "Snuggly: Skull Lantern -> Ring of Fog": 11110097,
+    "Snuggly: Ring of the Sun Princess -> Divine Blessing x2": 11110098,
+    "Snuggly: Xanthous Crown -> Ring of Favor and Protection": 11110099,
+    "Snuggly: Soul of Manus -> Sorcery: Pursuers": 11110100,
+    "UA2: Rusted Iron Ring": 11110078,
+    "UB: Undead Burg Basement opened": 11110101,
+    "UB: Undead Burg -> Lower Undead Burg opened": 11110102,
+    "UB: Twin Humanities - Lower Burg Torch Hollows": 11110103,
+    "UB: Mail Breaker": 11110104,
+    "UB: Large Soul of a Lost Undead - Barrel outside Capra": 11110105,
+    "UB: Large Soul of a Lost Undead - Hallway to Depths": 11110106,
+    "UB: Thief Mask": 11110565,
+    "UB: Black Leather Armor": 11110618,
+    "UB: Black Leather Gloves": 11110619,
+    "UB: Black Leather Boots": 11110620,
+    "UB: Target Shield": 11110566,
+    "UB: Undead Burg Female Merchant Shortcut opened": 11110107,
+    "UB: Capra Demon Defeated": 11110108,
+    "UB: Key to Depths": 11110109,
+    "UB: Sorcerer Hat": 11110110,
+    "UB: Sorcerer Cloak": 11110621,
+    "UB: Sorcerer Gauntlets": 11110622,
+    "UB: Sorcerer Boots": 11110623,
+    "UB: Sorcerer's Catalyst": 11110111,
+    "UB: Undead Burg Watchtower Upper opened": 11110051,
+    "UB: Havel's Ring": 11110049,
+    "UB: Undead Burg Watchtower Lower opened": 11110052,
+    "DE: Large Soul of a Nameless Soldier - Depths Entrance": 11110112,
+    "DE: Large Ember": 11110113,
+    "DE: Spider Shield - Ledge near Giant Rat": 11110114,
+    "DE: Soul of a Nameless Soldier - Ooze Trap": 11110115,
+    "DE: Greataxe": 11110116,
+    "DE: Sewer Chamber Key": 11110117,
+    "DE: Soul of a Nameless Soldier - Near Channeler": 11110118,
+    "DE: Soul of a Nameless Soldier - Giant Rat": 11110119,
+    "DE: Soul of a Nameless Soldier - Giant Rat Room Entrance": 11110564,
+    "DE: Large Titanite Shard - Depths Channeler": 11110120,
+    "DE: Large Soul of a Nameless Soldier - Depths Basalisks": 11110121,
+    "DE: Soul of a Nameless Soldier - Basilisk Sewer Maze": 11110122,
+    "DE: Ring of the Evil Eye": 11110123,
+    "DE: Humanity - Depths Pitfall Jump": 11110124,
+    "DE: Heavy Crossbow": 11110125,
+    "DE: Heavy Bolt": 11110624,
+    "DE: Depths Shortcut opened": 11110126,
+    "DE: Gaping Dragon Defeated": 11110127,
+    "DE: Blighttown Key": 11110128,
+    "DE: Standard Helm": 11110129,
+    "DE: Hard Leather Armor": 11110711,
+    "DE: Hard Leather Gauntlets": 11110712,
+    "DE: Hard Leather Boots": 11110713,
+    "DE: Depths Bonfire Room opened": 11110131,
+    "DE: Depths lit": 11110132,
+    "DE: Depths -> Blighttown opened": 11110130,
+    "BT: Soul of a Proud Knight - Blighttown Entrance Dropoff": 11110133,
+    "BT: Large Soul of a Nameless Soldier - Corpse at Left Ramp": 11110134,
+    "BT: Blooming Purple Moss Clump - Suspended Walkway": 11110135,
+    "BT: Humanity - Blighttown Swaying Bridge": 11110136,
+    "BT: Iaito": 11110137,
+    "BT: Blighttown Catwalk lit": 11110138,
+    "BT: Soul of a Proud Knight - Below Shadow Set": 11110139,
+    "BT: Soul of a Proud Knight - Corpse on Wooden Structure Ledge": 11110140,
+    "BT: Shadow Mask": 11110141,
+    "BT: Shadow Garb": 11110625,
+    "BT: Shadow Gauntlets": 11110626,
+    "BT: Shadow Leggings": 11110627,
+    "BT: Soul of a Proud Knight - Corpse in Wooden Structure near Third Catwalk": 11110142,
+    "BT: Eagle Shield": 11110143,
+    "BT: Pyromancy: Power Within": 11110144,
+    "BT: Large Soul of a Nameless Soldier - Wall Hugger": 11110145,
+    "BT: Wanderer Hood": 11110146,
+    "BT: Wanderer Coat": 11110628,
+    "BT: Wanderer Manchette": 11110629,
+    "BT: Wanderer Boots": 11110630,
+    "BT: Falchion": 11110147,
+    "BT: Large Soul of a Proud Knight - Corpse below Ramp": 11110148,
+    "BT: Whip": 11110595,
+    "BT: Dragon Scale - Blighttown": 11110149,
+    "BT: Butcher Knife": 11110150,
+    "BT: Humanity - Maneater Mildred": 11110151,
+    "BT: Blighttown Swamp lit": 11110152,
+    "BT: Large Soul of a Proud Knight - Quelana": 11110153,
+    "BT: Great Club": 11110154,
+    "BT: Tattered Cloth Hood": 11110155,
+    "BT: Tattered Cloth Robe": 11110631,
+    "BT: Tattered Cloth Manchette": 11110632,
+    "BT: Heavy Boots": 11110633,
+    "BT: Pyromancy: Poison Mist": 11110156,
+    "BT: Large Soul of a Proud Knight - Corpse between Bonfire and Great Hollow Entrance": 11110157,
+    "BT: Large Titanite Shard - Near Server": 11110158,
+    "BT: Server": 11110159,
+    "BT: Green Titanite Shard - Blighttown": 11110160,
+    "BT: Plank Shield": 11110161,
+    "BT: Twin Humanities - Great Hallow Entrance": 11110162,
+    "BT: Large Titanite Shard - Near Quelana": 11110163,
+    "BT: Chaos Witch Quelaag Defeated": 11110164,
+    "BT: Soul of Quelaag": 11110560,
+    "BT: Quelaag's Domain lit": 11110165,
+    "BT: Bell of Awakening #2 rung": 11110556,
+    "BT: Soul of a Proud Knight - Blighttown Fire Keeper Soul": 11110166,
+    "BT: Fire Keeper Soul - Blighttown": 11110167,
+    "BT: Mask of the Sealer": 11110168,
+    "BT: Crimson Robe": 11110634,
+    "BT: Crimson Gloves": 11110635,
+    "BT: Crimson Waistcloth": 11110636,
+    "BT: Tin Banishment Catalyst": 11110169,
+    "BT: Sorcery: Remedy": 11110170,
+    "BT: Key to New Londo Ruins": 11110171,
+    "VotD: Large Soul of a Nameless Soldier - New Londo Door": 11110173,
+    "VotD: Astora's Straight Sword": 11110174,
+    "VotD: Dragon Crest Shield": 11110175,
+    "VotD: Soul of a Proud Knight - Undead Dragon": 11110176,
+    "VotD: Humanity - Corpse in Small Cave": 11110178,
+    "VotD: Brigand Hood": 11110179,
+    "VotD: Brigand Armor": 11110637,
+    "VotD: Brigand Gauntlets": 11110638,
+    "VotD: Brigand Trousers": 11110639,
+    "VotD: Spider Shield - Brigand Armor Set": 11110180,
+    "VotD: Red Tearstone Ring": 11110181,
+    "VotD: Witch Hat": 11110182,
+    "VotD: Witch Cloak": 11110640,
+    "VotD: Witch Gloves": 11110641,
+    "VotD: Witch Skirt": 11110642,
+    "VotD: Beatrice's Catalyst": 11110183,
+    "VotD: New Londo Ruins -> Valley of the Drakes opened": 11110331,
+    "DB: Leather Armor": 11110185,
+    "DB: Leather Gloves": 11110705,
+    "DB: Leather Boots": 11110706,
+    "DB: Large Soul of a Nameless Soldier - Darkroot Hydra": 11110577,
+    "DB: Longbow": 11110186,
+    "DB: Feather Arrow": 11110707,
+    "DB: Grass Crest Shield": 11110187,
+    "DB: Darkroot Basin lit": 11110189,
+    "DB: Knight Helm": 11110190,
+    "DB: Knight Armor": 11110643,
+    "DB: Knight Gauntlets": 11110644,
+    "DB: Knight Leggings": 11110645,
+    "DG: Large Soul of a Nameless Soldier - Darkroot Cliff": 11110193,
+    "DG: Darkroot Garden lit": 11110194,
+    "DG: Large Soul of a Nameless Soldier - Darkroot Ambush": 11110195,
+    "DG: Elite Knight Helm": 11110196,
+    "DG: Elite Knight Armor": 11110649,
+    "DG: Elite Knight Gauntlets": 11110650,
+    "DG: Elite Knight Leggings": 11110651,
+    "DG: Wolf Ring": 11110197,
+    "DG: Soul of a Proud Knight - Past Fake Trees": 11110198,
+    "DG: Partizan": 11110199,
+    "DG: Moonlight Butterfly Defeated": 11110200,
+    "DG: Soul of the Moonlight Butterfly": 11110557,
+    "DG: Homeward Bone - Frozen Blacksmith": 11110201,
+    "DG: Watchtower Basement Key": 11110202,
+    "DG: Divine Ember": 11110203,
+    "DG: Eastern Helm": 11110553,
+    "DG: Eastern Armor": 11110652,
+    "DG: Eastern Gauntlets": 11110653,
+    "DG: Eastern Leggings": 11110654,
+    "DG: Stone Helm": 11110204,
+    "DG: Stone Armor": 11110655,
+    "DG: Stone Gauntlets": 11110656,
+    "DG: Stone Leggings": 11110657,
+    "DG: Large Soul of a Brave Warrior - Darkroot Garden Cats": 11110578,
+    "DG: Twin Humanities - Pharis": 11110208,
+    "DG: Soul of a Brave Warrior - Down Ladder before Stone Bridge": 11110209,
+    "DG: Enchanted Ember": 11110210,
+    "DG: Great Grey Wolf Sif Defeated": 11110211,
+    "DG: Best Boi Loot": 11110212,
+    "DG: Soul of Sif": 11110559,
+    "DG: Hornet Ring": 11110213,
+    "GH: The Great Hollow lit": 11110214,
+    "GH: Titanite Chunk - Drop on Top Branch": 11110586,
+    "GH: Blue Titanite Chunk - Second Last Drop before Floor": 11110587,
+    "GH: White Titanite Chunk - Third Last Drop before Floor": 11110588,
+    "GH: Red Titanite Chunk - Last Drop before Floor": 11110589,
+    "GH: Blue Titanite Chunk - Drop on Branch into Hole": 11110590,
+    "GH: White Titanite Chunk - Drop below Floor": 11110591,
+    "GH: Chloranthy Ring": 11110224,
+    "GH: Large Soul of a Nameless Soldier - Corpse Entry to Basilisks": 11110225,
+    "GH: Large Soul of a Nameless Soldier - Corpse on Lower Floor with Basilisks": 11110592,
+    "GH: Titanite Chunk - Corpse on Mushroom": 11110593,
+    "GH: Red Titanite Chunk - Near Top Branch Drop": 11110594,
+    "ASH: Ash Lake lit": 11110226,
+    "ASH: Dragon Scale - Ash Lake Start": 11110227,
+    "ASH: Dragon Scale - Ash Lake Water": 11110228,
+    "ASH: Dragon Scale - Ash Lake Log": 11110229,
+    "ASH: Miracle: Great Magic Barrier": 11110230,
+    "ASH: Ash Lake - Stone Dragon lit": 11110231,
+    "SF: Divine Blessing - Sen's Fortress": 11110611,
+    "SF: Rare Ring of Sacrifice - Sen's Fortress": 11110613,
+    "SF: Large Soul of a Proud Knight - Corpse after Ladder out of Pit": 11110614,
+    "SF: Sen's Fortress Main Gate opened": 11110232,
+    "SF: Soul of a Brave Warrior - Sen's Fortress Entrance": 11110233,
+    "SF: Soul of a Brave Warrior - Sen's Fortress Pit": 11110238,
+    "SF: Scythe": 11110239,
+    "SF: Large Titanite Shard - Sen's Fortress Trap Chest": 11110240,
+    "SF: Ring of Steel Protection": 11110241,
+    "SF: Shotel": 11110242,
+    "SF: Covetous Gold Serpent Ring": 11110243,
+    "SF: Lightning Spear": 11110244,
+    "SF: Large Soul of a Proud Knight - Sen's Fortress Ball Dropdown": 11110246,
+    "SF: Black Sorcerer Hat": 11110247,
+    "SF: Black Sorcerer Cloak": 11110658,
+    "SF: Black Sorcerer Gauntlets": 11110659,
+    "SF: Black Sorcerer Boots": 11110660,
+    "SF: Sorcery: Hush": 11110248,
+    "SF: Slumbering Dragoncrest Ring": 11110249,
+    "SF: Large Titanite Shard - Guarded by Serpent Soldier": 11110250,
+    "SF: Large Soul of a Brave Warrior - Sen's Fortress above Bonfire": 11110251,
+    "SF: Sen's Fortress lit": 11110252,
+    "SF: Flame Stoneplate Ring": 11110253,
+    "SF: Large Titanite Shard - Corpse bombed by Giant": 11110254,
+    "SF: Ricard's Rapier": 11110255,
+    "SF: Sniper Crossbow": 11110256,
+    "SF: Sniper Bolt": 11110661,
+    "SF: Cage Key": 11110257,
+    "SF: Iron Golem Defeated": 11110258,
+    "SF: Core of an Iron Golem": 11110259,
+    "SF: Soul of a Hero - Sen's Fortress Cage": 11110260,
+    "AL: Anor Londo lit": 11110261,
+    "AL: Demon Titanite - Anor Londo Giants": 11110262,
+    "AL: Crystal Halberd": 11110263,
+    "AL: Twinkling Titanite - Anor Londo": 11110264,
+    "AL: Demon Titanite - Anor Londo Elevator": 11110265,
+    "AL: Divine Blessing - Anor Londo Rafters": 11110266,
+    "AL: Anor Londo - Darkmoon Tomb lit": 11110267,
+    "AL: Ring of the Sun's Firstborn": 11110268,
+    "AL: Sorcery: Great Magic Weapon": 11110269,
+    "AL: Black Iron Helm": 11110270,
+    "AL: Black Iron Armor": 11110662,
+    "AL: Black Iron Gauntlets": 11110663,
+    "AL: Black Iron Leggings": 11110664,
+    "AL: Greatsword": 11110271,
+    "AL: Black Iron Greatshield": 11110272,
+    "AL: Anor Londo - Residence lit": 11110273,
+    "AL: Soul of a Hero - Left Silver Archer": 11110274,
+    "AL: Sunlight Medal - Anor Londo": 11110275,
+    "AL: Havel's Helm": 11110276,
+    "AL: Havel's Armor": 11110665,
+    "AL: Havel's Gauntlets": 11110616,
+    "AL: Havel's Leggings": 11110666,
+    "AL: Dragon Tooth": 11110277,
+    "AL: Havel's Greatshield": 11110278,
+    "AL: Occult Club": 11110279,
+    "AL: Soul of a Hero - Anor Londo Rooms": 11110280,
+    "AL: Gold Coin - Anor Londo Mimic": 11110282,
+    "AL: Silver Coin - Anor Londo Mimic": 11110283,
+    "AL: Demon Titanite - Anor Londo Bedroom": 11110284,
+    "AL: Silver Knight Helm": 11110285,
+    "AL: Silver Knight Armor": 11110667,
+    "AL: Silver Knight Gauntlets": 11110286,
+    "AL: Silver Knight Leggings": 11110668,
+    "AL: Anor Londo Bonfire Shortcut opened": 11110287,
+    "AL: Dragonslayer Greatbow": 11110288,
+    "AL: Dragonslayer Arrow": 11110714,
+    "AL: Titanite Chunk - near Giant Blacksmith": 11110289,
+    "AL: Hawk Ring": 11110290,
+    "AL: Anor Londo Giant Blacksmith Shortcut opened": 11110291,
+    "AL: Anor Londo Main Hall Door opened": 11110292,
+    "AL: Ornstein and Smough Defeated": 11110293,
+    "AL: Soul of Ornstein": 11110561,
+    "AL: Soul of Smough": 11110562,
+    "AL: Lordvessel": 11110294,
+    "AL: Gwyndolin Defeated": 11110295,
+    "AL: Soul of Gwyndolin": 11110296,
+    "AL: Brass Helm": 11110297,
+    "AL: Brass Armor": 11110669,
+    "AL: Brass Gauntlets": 11110670,
+    "AL: Brass Leggings": 11110671,
+    "AL: Miracle: Sunlight Blade": 11110298,
+    "AL: Anor Londo Chamber of the Princess lit": 11110555,
+    "PW: Painted World lit": 11110299,
+    "PW: Humanity - Painted World Hanging Body": 11110300,
+    "PW: Soul of a Proud Knight - Corpse up First Staircase": 11110571,
+    "PW: Soul of a Proud Knight - Corpse near Bonewheels": 11110572,
+    "PW: Soul of a Proud Knight - By Hanging Corpse": 11110575,
+    "PW: Ring of Sacrifice - Painted World": 11110573,
+    "PW: Soul of a Brave Warrior - Next to Stairs": 11110574,
+    "PW: Soul of a Brave Warrior - Corpse at Backside Tower Corner": 11110576,
+    "PW: Soul of a Proud Knight - Painted World Corvid Ambush": 11110301,
+    "PW: Twin Humanities - Painted World": 11110302,
+    "PW: Soul of a Brave Warrior - Corpse Hanging out of Hole": 11110303,
+    "PW: Soul of a Brave Warrior - Painted World Albino Rats": 11110304,
+    "PW: Painting Guardian Hood": 11110305,
+    "PW: Painting Guardian Robe": 11110708,
+    "PW: Painting Guardian Gloves": 11110709,
+    "PW: Painting Guardian Waistcloth": 11110710,
+    "PW: Egg Vermifuge - Painted World": 11110306,
+    "PW: Velka's Rapier": 11110307,
+    "PW: Large Soul of a Proud Knight - Ambush after Building": 11110308,
+    "PW: Red Sign Soapstone": 11110310,
+    "PW: Soul of a Brave Warrior - Painted World Tower": 11110311,
+    "PW: Bloodshield": 11110313,
+    "PW: Large Soul of a Proud Knight - Painted World Undead Dragon": 11110314,
+    "PW: Soul of a Proud Knight - Jeremiah 1": 11110315,
+    "PW: Soul of a Proud Knight - Jeremiah 2": 11110316,
+    "PW: Large Soul of a Proud Knight - Jeremiah": 11110317,
+    "PW: Pyromancy: Acid Surge": 11110318,
+    "PW: Notched Whip": 11110319,
+    "PW: Soul of a Brave Warrior - Painted World Bonewheels": 11110320,
+    "PW: Pyromancy: Fire Surge": 11110321,
+    "PW: Annex Key": 11110322,
+    "PW: Humanity - Painted World Courtyard": 11110323,
+    "PW: Crossbreed Priscilla Defeated": 11110325,
+    "PW: Soul of Priscilla": 11110326,
+    "PW: Xanthous Crown": 11110327,
+    "PW: Xanthous Overcoat": 11110672,
+    "PW: Xanthous Gloves": 11110673,
+    "PW: Xanthous Waistcloth": 11110674,
+    "PW: Dark Ember": 11110309,
+    "PW: Miracle: Vow of Silence": 11110328,
+    "PW: Mask of Velka": 11110329,
+    "PW: Black Cleric Robe": 11110675,
+    "PW: Black Manchette": 11110676,
+    "PW: Black Tights": 11110677,
+    "PW: Gold Coin - Painted World": 11110330,
+    "NL: Soul of a Nameless Soldier - New Londo Entrance": 11110332,
+    "NL: Estoc": 11110333,
+    "NL: Transient Curse - Before Ghosts": 11110334,
+    "NL: Fire Keeper Soul - New Londo": 11110335,
+    "NL: Transient Curse - 2x Transient Curses from Corpse inside Pot behind Wall": 11110336,
+    "NL: Parrying Dagger": 11110337,
+    "NL: Transient Curse - Banshee": 11110338,
+    "NL: Large Soul of a Nameless Soldier - Near Ladder Shortcut": 11110339,
+    "NL: Key to the Seal": 11110340,
+    "NL: Soul of a Proud Knight - New Londo Back Corridor": 11110341,
+    "NL: Cursebite Ring": 11110342,
+    "NL: Green Titanite Shard - New Londo": 11110343,
+    "NL: Large Soul of a Nameless Soldier - Corpse before Seal": 11110344,
+    "NL: Humanity - New Londo Ledge": 11110345,
+    "NL: Rare Ring of Sacrifice - New Londo Roof": 11110346,
+    "NL: Composite Bow": 11110347,
+    "NL: Large Arrow": 11110678,
+    "NL: New Londo Ruins Door to the Seal opened": 11110348,
+    "NL: Humanity - Lower New Londo Ruins": 11110703,
+    "NL: Large Soul of a Proud Knight - Right Path after Stairs": 11110704,
+    "NL: Large Soul of a Proud Knight - Corpse in Shed": 11110349,
+    "NL: Soul of a Brave Warrior - New Londo Stairs": 11110350,
+    "NL: Very Large Ember": 11110351,
+    "NL: Large Soul of a Proud Knight - Corpse before Illusory Wall": 11110352,
+    "NL: Titanite Chunk - Chest before Four Kings": 11110353,
+    "NL: Cracked Red Eye Orb - New Londo": 11110354,
+    "NL: Large Soul of a Proud Knight - Corpse on Stairs": 11110355,
+    "NL: Titanite Chunk - Chest behind Illusory Wall": 11110356,
+    "TA: Four Kings Defeated": 11110357,
+    "TA: Bequeathed Lord Soul Shard (Four Kings)": 11110358,
+    "TA: The Abyss lit": 11110359,
+    "DA: Duke's Archives - Entrance lit": 11110360,
+    "DA: Soul of a Brave Warrior - Archives Under Stairs": 11110362,
+    "DA: Twinkling Titanite - Archives Chest": 11110363,
+    "DA: Twinkling Titanite - Archives Balcony": 11110364,
+    "DA: Duke's Archives Cell lit": 11110367,
+    "DA: Archive Tower Cell Key": 11110369,
+    "DA: Duke's Archives Cell Door opened": 11110368,
+    "DA: Archive Prison Extra Key": 11110370,
+    "DA: Large Soul of a Brave Warrior - In Reah's Cell": 11110371,
+    "DA: Maiden Hood": 11110372,
+    "DA: Maiden Robe": 11110679,
+    "DA: Maiden Gloves": 11110680,
+    "DA: Maiden Skirt": 11110681,
+    "DA: White Seance Ring": 11110373,
+    "DA: Large Soul of a Brave Warrior - Archives Cell": 11110374,
+    "DA: Soul of a Brave Warrior - Archives Cell Scafolding": 11110375,
+    "DA: Archive Tower Giant Door Key": 11110376,
+    "DA: Avelyn": 11110379,
+    "DA: Twinkling Titanite - Archives Chest 2": 11110380,
+    "DA: Sorcery: Strong Magic Shield": 11110381,
+    "DA: Duke's Archives - Balcony lit": 11110382,
+    "DA: Duke's Archives Bookshelf Door opened": 11110383,
+    "DA: Blue Titanite Chunk - Archives Chest": 11110384,
+    "DA: Enchanted Falchion": 11110385,
+    "DA: Archive Tower Giant Cell Key": 11110386,
+    "DA: Crystal Ember": 11110387,
+    "DA: Six-Eyed Helm of the Channelers": 11110388,
+    "DA: Robe of the Channelers": 11110682,
+    "DA: Gauntlets of the Channelers": 11110683,
+    "DA: Waistcloth of the Channelers": 11110684,
+    "DA: Prism Stone - Duke's Archives": 11110389,
+    "DA: Crystalline Helm": 11110390,
+    "DA: Crystalline Armor": 11110685,
+    "DA: Crystalline Gauntlets": 11110686,
+    "DA: Crystalline Leggings": 11110687,
+    "DA: Blue Titanite Chunk - Archives Courtyard": 11110391,
+    "DA: Fire Keeper Soul - Archives Giant Cell": 11110392,
+    "CC: Humanity - Crystal Caverns": 11110393,
+    "CC: Blue Titanite Chunk - Crystal Caverns": 11110394,
+    "CC: Blue Titanite Slab - Crystal Caverns": 11110398,
+    "CC: Soul of a Hero - Crystal Caverns": 11110399,
+    "CC: Seath the Scaleless Defeated": 11110400,
+    "CC: Bequeathed Lord Soul Shard (Seath)": 11110401,
+    "CC: Crystal Cave lit": 11110402,
+    "DA: Large Magic Ember": 11110403,
+    "DA: Soul of a Great Hero - Seath Room": 11110404,
+    "DR: Demon Ruins - Entrance lit": 11110405,
+    "DR: Gold-Hemmed Black Hood": 11110406,
+    "DR: Gold-Hemmed Black Cloak": 11110688,
+    "DR: Gold-Hemmed Black Gloves": 11110689,
+    "DR: Gold-Hemmed Black Skirt": 11110690,
+    "DR: Ceaseless Discharge Defeated": 11110407,
+    "DR: Large Soul of a Proud Knight - First Jump over the Lava": 11110408,
+    "DR: Chaos Flame Ember": 11110409,
+    "DR: Soul of a Proud Knight - Ceased Discharge": 11110410,
+    "DR: Demon Ruins - Staircase lit": 11110412,
+    "DR: Green Titanite Shard - 2x Green Titanite Shards under the Staircase": 11110413,
+    "DR: Soul of a Proud Knight - Ledge Corpse Top of Stairs": 11110609,
+    "DR: Soul of a Proud Knight - Demon Ruins Bonfire": 11110414,
+    "DR: Large Flame Ember": 11110415,
+    "DR: Soul of a Brave Warrior - Capra Outside Firesage": 11110416,
+    "DR: Soul of a Brave Warrior - On Platform Below Roots to Centipede": 11110602,
+    "DR: Demon Firesage Defeated": 11110417,
+    "DR: Soul of a Brave Warrior - Ruins/Domain shortcut": 11110419,
+    "DR: Soul of a Brave Warrior - Chaos Door": 11110420,
+    "DR: Demon Ruins - Catacombs lit": 11110421,
+    "DR: Centipede Demon Defeated": 11110422,
+    "DR: Orange Charred Ring": 11110423,
+    "DR: Green Titanite Shard - Centipede Demon": 11110424,
+    "DR: Demon Ruins Shortcut opened": 11110439,
+    "LI: Helm of Thorns": 11110411,
+    "LI: Armor of Thorns": 11110691,
+    "LI: Gauntlets of Thorns": 11110692,
+    "LI: Leggings of Thorns": 11110693,
+    "LI: Lost Izalith - Lava Pits lit": 11110426,
+    "LI: Soul of a Brave Warrior - First Platform after Entrance": 11110427,
+    "LI: Soul of a Brave Warrior - Near Soul of a Great Hero Chest": 11110428,
+    "LI: Soul of a Great Hero - Lost Izalith": 11110429,
+    "LI: Twin Humanities - Lost Izalith": 11110430,
+    "LI: Divine Blessing - Izalith Lava 1": 11110431,
+    "LI: Divine Blessing - Izalith Lava 2": 11110432,
+    "LI: Lost Izalith - Past Illusory Wall lit": 11110433,
+    "LI: Large Soul of a Brave Warrior - Izalith City": 11110434,
+    "LI: Soul of a Hero - Izalith City": 11110435,
+    "LI: Rare Ring of Sacrifice - Izalith City": 11110436,
+    "LI: Red Titanite Chunk - Inside Chaos Eater Pit": 11110440,
+    "LI: Green Titanite Shard - Chaos Eater Pit": 11110441,
+    "LI: Soul of a Brave Warrior - Inside Chaos Eater Pit": 11110442,
+    "LI: Red Titanite Slab - Chaos Eater Pit": 11110443,
+    "LI: Red Titanite Chunk - After Chaos Eater Pit": 11110596,
+    "LI: Pyromancy: Chaos Fire Whip": 11110444,
+    "LI: Izalith Catalyst": 11110563,
+    "LI: Bed of Chaos Defeated": 11110445,
+    "LI: Lord Soul (Bed of Chaos)": 11110446,
+    "LI: Lost Izalith - Heart of Chaos lit": 11110447,
+    "TC: Catacombs - Necromancer Cave lit": 11110448,
+    "TC: Catacombs Door 1 opened": 11110449,
+    "TC: Darkmoon Seance Ring": 11110579,
+    "TC: Lucerne": 11110450,
+    "TC: Large Soul of a Nameless Soldier - Room before First Rotating Bridge": 11110451,
+    "TC: Soul of a Proud Knight - After Second Switch": 11110452,
+    "TC: Soul of a Proud Knight - First Spiral Stairway Upper": 11110455,
+    "TC: Soul of a Proud Knight - First Spiral Stairway Lower": 11110456,
+    "TC: Great Scythe": 11110457,
+    "TC: Catacombs - Past Illusory Wall lit": 11110458,
+    "TC: Catacombs Door 2 opened": 11110459,
+    "TC: Green Titanite Shard - On Platform near Vamos": 11110460,
+    "TC: Catacombs - Vamos lit": 11110461,
+    "TC: Miracle: Tranquil Walk of Peace": 11110462,
+    "TC: Eye of Death - Catacombs Titanite Demon": 11110464,
+    "TC: Large Soul of a Nameless Soldier - Above Black Knight": 11110465,
+    "TC: Soul of a Proud Knight - Black Knight Ledge": 11110466,
+    "TC: Large Soul of a Nameless Soldier - Catacombs Above Bonewheels": 11110468,
+    "TC: Priest's Hat": 11110469,
+    "TC: Holy Robe": 11110694,
+    "TC: Traveling Gloves": 11110695,
+    "TC: Holy Trousers": 11110696,
+    "TC: Mace": 11110552,
+    "TC: Pinwheel Defeated": 11110470,
+    "TC: Rite of Kindling": 11110471,
+    "TC: Soul of a Proud Knight - Above Pinwheel": 11110472,
+    "TotG: Large Soul of a Proud Knight - Right after Green Light Slide": 11110580,
+    "TotG: Large Soul of a Proud Knight - Ledge Overlooking Pinwheel": 11110581,
+    "TotG: Soul of a Brave Warrior - Behind Bone Archer": 11110486,
+    "TotG: Large Soul of a Proud Knight - Giant Coffin Drop": 11110585,
+    "TotG: Large Soul of a Proud Knight - Upper Giant Coffin": 11110473,
+    "TotG: Humanity - Corpse on Ledge": 11110474,
+    "TotG: Tomb of the Giants - Patches lit": 11110475,
+    "TotG: Large Soul of a Proud Knight - Patches Pit 1": 11110476,
+    "TotG: Large Soul of a Proud Knight - Patches Pit 2": 11110477,
+    "TotG: White Titanite Chunk - Patches Kick": 11110491,
+    "TotG: White Titanite Chunk - Lower Tomb of the Giants": 11110492,
+    "TotG: Skull Lantern": 11110478,
+    "TotG: Eye of Death - Upper Giant Coffin": 11110479,
+    "TotG: Large Divine Ember": 11110480,
+    "TotG: Soul of a Brave Warrior - Lower Giant Coffin": 11110481,
+    "TotG: Effigy Shield": 11110482,
+    "TotG: Tomb of the Giants lit": 11110483,
+    "TotG: Covetous Silver Serpent Ring": 11110484,
+    "TotG: Soul of a Brave Warrior - Lower Tomb of the Giants": 11110582,
+    "TotG: Paladin Leeroy Loot": 11110488,
+    "TotG: Humanity - Paladin Leeroy": 11110489,
+    "TotG: White Titanite Slab - Outside Nito": 11110490,
+    "TotG: Soul of a Hero - Pinwheel Clone Room Entryway": 11110583,
+    "TotG: Soul of a Hero - Outside Nito": 11110493,
+    "TotG: Gravelord Nito Defeated": 11110494,
+    "TotG: White Titanite Chunk - Outside Nito": 11110584,
+    "TotG: Lord Soul (Nito)": 11110495,
+    "TotG: Tomb of the Giants - Altar of the Gravelord lit": 11110496,
+    "TotG: Paladin Helm": 11110497,
+    "TotG: Paladin Armor": 11110697,
+    "TotG: Paladin Gauntlets": 11110698,
+    "TotG: Paladin Leggings": 11110699,
+    "KoFF: Black Knight Helm": 11110498,
+    "KoFF: Black Knight Armor": 11110700,
+    "KoFF: Black Knight Gauntlets": 11110701,
+    "KoFF: Black Knight Leggings": 11110702,
+    "KoFF: Gwyn, Lord of Cinder Defeated": 11110499,
+    "KoFF: Soul of Gwyn, Lord of Cinder": 11110500,
+}
+
+item_name_groups = {
+    "Key Items": {
+        "Annex Key",
+        "Archive Prison Extra Key",
+        "Archive Tower Cell Key",
+        "Archive Tower Giant Cell Key",
+        "Archive Tower Giant Door Key",
+        "Armor Smithbox",
+        "Basement Key",
+        "Bequeathed Lord Soul Shard (Four Kings)",
+        "Bequeathed Lord Soul Shard (Seath)",
+        "Big Pilgrim's Key",
+        "Blighttown Key",
+        "Bloodred Moss Clump",
+        "Blooming Purple Moss Clump",
+        "Bottomless Box",
+        "Broken Pendant",
+        "Cage Key",
+        "Covenant of Artorias",
+        "Cracked Red Eye Orb",
+        "Crest Key",
+        "Crest of Artorias",
+        "Dung Pie",
+        "Dungeon Cell Key",
+        "Egg Vermifuge",
+        "Estus Flask",
+        "Fire Keeper Soul (Anastacia of Astora)",
+        "Fire Keeper Soul (Blighttown)",
+        "Fire Keeper Soul (Darkmoon Knightess)",
+        "Fire Keeper Soul (Daughter of Chaos)",
+        "Fire Keeper Soul (Duke's Archives)",
+        "Fire Keeper Soul (New Londo)",
+        "Fire Keeper Soul (Undead Parish)",
+        "Humanity",
+        "Key to Depths",
+        "Key to New Londo Ruins",
+        "Key to the Seal",
+        "Lord Soul (Bed of Chaos)",
+        "Lord Soul (Nito)",
+        "Lordvessel",
+        "Master Key",
+        "Mystery Key",
+        "Orange Charred Ring",
+        "Peculiar Doll",
+        "Pendant",
+        "Prism Stone",
+        "Purple Moss Clump",
+        "Pyromancy Flame",
+        "Pyromancy Flame (Ascended)",
+        "Repairbox",
+        "Residence Key",
+        "Ring of the Sun Princess",
+        "Rite of Kindling",
+        "Rubbish",
+        "Sack",
+        "Sewer Chamber Key",
+        "Skull Lantern",
+        "Soul of Manus",
+        "Souvenir of Reprisal",
+        "Sunlight Maggot",
+        "Sunlight Medal",
+        "Twin Humanities",
+        "Undead Asylum F2 East Key",
+        "Undead Asylum F2 West Key",
+        "Watchtower Basement Key",
+        "Weapon Smithbox",
+        "Xanthous Crown",
+    },
+    "Consumables": {
+        "Alluring Skull",
+        "Binoculars",
+        "Black Eye Orb",
+        "Black Firebomb",
+        "Black Separation Crystal",
+        "Bloodred Moss Clump",
+        "Blooming Purple Moss Clump",
+        "Blue Eye Orb",
+        "Book of the Guilty",
+        "Carving: HELLO!",
+        "Carving: HELP ME!",
+        "Carving: I'M SORRY!",
+        "Carving: THANK YOU!",
+        "Carving: VERY GOOD!",
+        "Charcoal Pine Resin",
+        "Copper Coin",
+        "Core of an Iron Golem",
+        "Cracked Red Eye Orb",
+        "Darksign",
+        "Divine Blessing",
+        "Dragon Eye",
+        "Dragon Head Stone",
+        "Dragon Torso Stone",
+        "Dried Finger",
+        "Dung Pie",
+        "Egg Vermifuge",
+        "Elizabeth's Mushroom",
+        "Eye of Death",
+        "Firebomb",
+        "Gold Coin",
+        "Gold Pine Resin",
+        "Green Blossom",
+        "Homeward Bone",
+        "Humanity",
+        "Indictment",
+        "Lloyd's Talisman",
+        "Orange Guidance Soapstone",
+        "Pendant",
+        "Poison Throwing Knife",
+        "Prism Stone",
+        "Purging Stone",
+        "Purple Coward's Crystal",
+        "Purple Moss Clump",
+        "Red Eye Orb",
+        "Red Sign Soapstone",
+        "Repair Powder",
+        "Rotten Pine Resin",
+        "Rubbish",
+        "Servant Roster",
+        "Silver Coin",
+        "Silver Pendant",
+        "Souvenir of Reprisal",
+        "Sunlight Medal",
+        "Throwing Knife",
+        "Transient Curse",
+        "Twin Humanities",
+        "White Sign Soapstone",
+    },
+    "Souls": {
+        "Guardian Soul",
+        "Large Soul of a Brave Warrior",
+        "Large Soul of a Lost Undead",
+        "Large Soul of a Nameless Soldier",
+        "Large Soul of a Proud Knight",
+        "Sorcery: Crystal Soul Spear",
+        "Sorcery: Great Heavy Soul Arrow",
+        "Sorcery: Great Soul Arrow",
+        "Sorcery: Heavy Soul Arrow",
+        "Sorcery: Homing Crystal Soulmass",
+        "Sorcery: Homing Soulmass",
+        "Sorcery: Soul Arrow",
+        "Sorcery: Soul Spear",
+        "Soul of Artorias",
+        "Soul of Gwyn, Lord of Cinder",
+        "Soul of Gwyndolin",
+        "Soul of Manus",
+        "Soul of Moonlight Butterfly",
+        "Soul of Ornstein",
+        "Soul of Priscilla",
+        "Soul of Quelaag",
+        "Soul of Sif",
+        "Soul of Smough",
+        "Soul of a Brave Warrior",
+        "Soul of a Great Hero",
+        "Soul of a Hero",
+        "Soul of a Lost Undead",
+        "Soul of a Nameless Soldier",
+        "Soul of a Proud Knight",
+    },
+    "Upgrade Materials": {
+        "Blue Titanite Chunk",
+        "Blue Titanite Slab",
+        "Chaos Flame Ember",
+        "Crystal Ember",
+        "Dark Ember",
+        "Demon Titanite",
+        "Divine Ember",
+        "Dragon Scale",
+        "Enchanted Ember",
+        "Green Titanite Shard",
+        "Large Divine Ember",
+        "Large Ember",
+        "Large Flame Ember",
+        "Large Magic Ember",
+        "Large Titanite Shard",
+        "Red Titanite Chunk",
+        "Red Titanite Slab",
+        "Titanite Chunk",
+        "Titanite Shard",
+        "Titanite Slab",
+        "Twinkling Titanite",
+        "Very Large Ember",
+        "White Titanite Chunk",
+        "White Titanite Slab",
+    },
+    "Equipment": {
+        "Abyss Greatsword",
+        "Anklet of the Great Lord",
+        "Antiquated Dress",
+        "Antiquated Gloves",
+        "Antiquated Skirt",
+        "Armor of Artorias",
+        "Armor of Thorns",
+        "Armor of the Glorious",
+        "Armor of the Sun",
+        "Astora's Straight Sword",
+        "Avelyn",
+        "Balder Armor",
+        "Balder Gauntlets",
+        "Balder Helm",
+        "Balder Leggings",
+        "Balder Shield",
+        "Balder Side Sword",
+        "Bandit's Knife",
+        "Barbed Straight Sword",
+        "Bastard Sword",
+        "Battle Axe",
+        "Beatrice's Catalyst",
+        "Bellowing Dragoncrest Ring",
+        "Big Hat",
+        "Black Bow of Pharis",
+        "Black Cleric Robe",
+        "Black Iron Armor",
+        "Black Iron Gauntlets",
+        "Black Iron Greatshield",
+        "Black Iron Helm",
+        "Black Iron Leggings",
+        "Black Knight Armor",
+        "Black Knight Gauntlets",
+        "Black Knight Greataxe",
+        "Black Knight Greatsword",
+        "Black Knight Halberd",
+        "Black Knight Helm",
+        "Black Knight Leggings",
+        "Black Knight Shield",
+        "Black Knight Sword",
+        "Black Leather Armor",
+        "Black Leather Boots",
+        "Black Leather Gloves",
+        "Black Manchette",
+        "Black Sorcerer Boots",
+        "Black Sorcerer Cloak",
+        "Black Sorcerer Gauntlets",
+        "Black Sorcerer Hat",
+        "Black Tights",
+        "Blacksmith Giant Hammer",
+        "Blacksmith Hammer",
+        "Bloated Head",
+        "Bloated Sorcerer Head",
+        "Blood-Stained Skirt",
+        "Bloodbite Ring",
+        "Bloodshield",
+        "Blue Tearstone Ring",
+        "Bonewheel Shield",
+        "Boots of the Explorer",
+        "Bracelet of the Great Lord",
+        "Brass Armor",
+        "Brass Gauntlets",
+        "Brass Helm",
+        "Brass Leggings",
+        "Brigand Armor",
+        "Brigand Gauntlets",
+        "Brigand Hood",
+        "Brigand Trousers",
+        "BroadSword",
+        "Broken Straight Sword",
+        "Buckler",
+        "Butcher Knife",
+        "Caduceus Kite Shield",
+        "Caduceus Round Shield",
+        "Caestus",
+        "Calamity Ring",
+        "Canvas Talisman",
+        "Cat Covenant Ring",
+        "Catarina Armor",
+        "Catarina Gauntlets",
+        "Catarina Helm",
+        "Catarina Leggings",
+        "Chain Armor",
+        "Chain Helm",
+        "Chain Leggings",
+        "Channeler's Trident",
+        "Chaos Blade",
+        "Chester's Gloves",
+        "Chester's Long Coat",
+        "Chester's Trousers",
+        "Claw",
+        "Claymore",
+        "Cleansing Greatshield",
+        "Cleric Armor",
+        "Cleric Gauntlets",
+        "Cleric Helm",
+        "Cleric Leggings",
+        "Cloranthy Ring",
+        "Club",
+        "Composite Bow",
+        "Covenant of Artorias",
+        "Covetous Gold Serpent Ring",
+        "Covetous Silver Serpent Ring",
+        "Cracked Round Shield",
+        "Crescent Axe",
+        "Crest Shield",
+        "Crimson Gloves",
+        "Crimson Robe",
+        "Crimson Waistcloth",
+        "Crown of Dusk",
+        "Crown of the Dark Sun",
+        "Crown of the Great Lord",
+        "Crystal Greatsword",
+        "Crystal Ring Shield",
+        "Crystal Shield",
+        "Crystal Straight Sword",
+        "Crystalline Armor",
+        "Crystalline Gauntlets",
+        "Crystalline Helm",
+        "Crystalline Leggings",
+        "Cursebite Ring",
+        "Dagger",
+        "Dark Armor",
+        "Dark Gauntlets",
+        "Dark Hand",
+        "Dark Leggings",
+        "Dark Mask",
+        "Dark Silver Tracer",
+        "Dark Wood Grain Ring",
+        "Darkmoon Blade Covenant Ring",
+        "Darkmoon Bow",
+        "Darkmoon Seance Ring",
+        "Darkmoon Talisman",
+        "Darksword",
+        "Demon Great Machete",
+        "Demon's Catalyst",
+        "Demon's Great Hammer",
+        "Demon's Greataxe",
+        "Demon's Spear",
+        "Dingy Gloves",
+        "Dingy Hood",
+        "Dingy Robe",
+        "Dragon Bone Fist",
+        "Dragon Crest Shield",
+        "Dragon Greatsword",
+        "Dragon King Greataxe",
+        "Dragon Tooth",
+        "Dragonslayer Arrow",
+        "Dragonslayer Greatbow",
+        "Dragonslayer Spear",
+        "Drake Sword",
+        "Dusk Crown Ring",
+        "Eagle Shield",
+        "East Wood Grain Ring",
+        "East-West Shield",
+        "Eastern Armor",
+        "Eastern Gauntlets",
+        "Eastern Helm",
+        "Eastern Leggings",
+        "Effigy Shield",
+        "Elite Cleric Armor",
+        "Elite Cleric Gauntlets",
+        "Elite Cleric Helm",
+        "Elite Cleric Leggings",
+        "Elite Knight Armor",
+        "Elite Knight Gauntlets",
+        "Elite Knight Helm",
+        "Elite Knight Leggings",
+        "Embraced Armor of Favor",
+        "Estoc",
+        "Falchion",
+        "Fang Boar Helm",
+        "Feather Arrow",
+        "Fire Arrow",
+        "Flamberge",
+        "Flame Stoneplate Ring",
+        "Four-pronged Plow",
+        "Gargoyle Helm",
+        "Gargoyle Tail Axe",
+        "Gargoyle's Shield",
+        "Gargoyles's Halberd",
+        "Gauntlets of Artorias",
+        "Gauntlets of Favor",
+        "Gauntlets of Thorns",
+        "Gauntlets of the Channelers",
+        "Gauntlets of the Vanquisher",
+        "Ghost Blade",
+        "Giant Armor",
+        "Giant Gauntlets",
+        "Giant Helm",
+        "Giant Leggings",
+        "Giant Shield",
+        "Giant's Halberd",
+        "Gold Tracer",
+        "Gold-Hemmed Black Cloak",
+        "Gold-Hemmed Black Gloves",
+        "Gold-Hemmed Black Hood",
+        "Gold-Hemmed Black Skirt",
+        "Golem Armor",
+        "Golem Axe",
+        "Golem Gauntlets",
+        "Golem Helm",
+        "Golem Leggings",
+        "Gough's Armor",
+        "Gough's Gauntlets",
+        "Gough's Great Arrow",
+        "Gough's Greatbow",
+        "Gough's Helm",
+        "Gough's Leggings",
+        "Grant",
+        "Grass Crest Shield",
+        "Gravelord Sword",
+        "Great Club",
+        "Great Lord Greatsword",
+        "Great Scythe",
+        "Greataxe",
+        "Greatshield of Artorias",
+        "Greatsword",
+        "Greatsword of Artorias",
+        "Greatsword of Artorias (Cursed)",
+        "Guardian Armor",
+        "Guardian Gauntlets",
+        "Guardian Helm",
+        "Guardian Leggings",
+        "Guardian Tail",
+        "Halberd",
+        "Hammer of Vamos",
+        "Hand Axe",
+        "Hard Leather Armor",
+        "Hard Leather Boots",
+        "Hard Leather Gauntlets",
+        "Havel's Armor",
+        "Havel's Gauntlets",
+        "Havel's Greatshield",
+        "Havel's Helm",
+        "Havel's Leggings",
+        "Havel's Ring",
+        "Hawk Ring",
+        "Heater Shield",
+        "Heavy Bolt",
+        "Heavy Boots",
+        "Heavy Crossbow",
+        "Helm of Artorias",
+        "Helm of Favor",
+        "Helm of Thorns",
+        "Helm of the Wise",
+        "Hollow Soldier Armor",
+        "Hollow Soldier Helm",
+        "Hollow Soldier Shield",
+        "Hollow Soldier Waistcloth",
+        "Hollow Thief's Hood",
+        "Hollow Thief's Leather Armor",
+        "Hollow Thief's Tights",
+        "Hollow Warrior Armor",
+        "Hollow Warrior Helm",
+        "Hollow Warrior Waistcloth",
+        "Holy Robe",
+        "Holy Trousers",
+        "Hornet Ring",
+        "Iaito",
+        "Iron Bracelet",
+        "Iron Helm",
+        "Iron Leggings",
+        "Iron Round Shield",
+        "Ivory Talisman",
+        "Izalith Catalyst",
+        "Jagged Ghost Blade",
+        "Knight Armor",
+        "Knight Gauntlets",
+        "Knight Helm",
+        "Knight Leggings",
+        "Knight Shield",
+        "Large Arrow",
+        "Large Club",
+        "Large Leather Shield",
+        "Leather Armor",
+        "Leather Boots",
+        "Leather Gauntlets",
+        "Leather Gloves",
+        "Leather Shield",
+        "Leggings of Artorias",
+        "Leggings of Favor",
+        "Leggings of Thorns",
+        "Leo Ring",
+        "Lifehunt Scythe",
+        "Light Crossbow",
+        "Lightning Bolt",
+        "Lingering Dragoncrest Ring",
+        "Logan's Catalyst",
+        "Longbow",
+        "Longsword",
+        "Lord's Blade Gloves",
+        "Lord's Blade Robe",
+        "Lord's Blade Waistcloth",
+        "Lucerne",
+        "Mace",
+        "Maiden Gloves",
+        "Maiden Hood",
+        "Maiden Robe",
+        "Maiden Skirt",
+        "Mail Breaker",
+        "Man-Serpent Greatsword",
+        "Manus Catalyst",
+        "Mask of Velka",
+        "Mask of the Child",
+        "Mask of the Father",
+        "Mask of the Mother",
+        "Mask of the Sealer",
+        "Miracle: Bountiful Sunlight",
+        "Miracle: Darkmoon Blade",
+        "Miracle: Emit Force",
+        "Miracle: Escape Death",
+        "Miracle: Force",
+        "Miracle: Gravelord Greatsword Dance",
+        "Miracle: Gravelord Sword Dance",
+        "Miracle: Great Heal",
+        "Miracle: Great Heal Excerpt",
+        "Miracle: Great Lightning Spear",
+        "Miracle: Great Magic Barrier",
+        "Miracle: Heal",
+        "Miracle: Homeward",
+        "Miracle: Karmic Justice",
+        "Miracle: Lightning Spear",
+        "Miracle: Magic Barrier",
+        "Miracle: Replenishment",
+        "Miracle: Seek Guidance",
+        "Miracle: Soothing Sunlight",
+        "Miracle: Sunlight Blade",
+        "Miracle: Sunlight Spear",
+        "Miracle: Tranquil Walk of Peace",
+        "Miracle: Vow of Silence",
+        "Miracle: Wrath of the Gods",
+        "Moonlight Arrow",
+        "Moonlight Butterfly Horn",
+        "Moonlight Gloves",
+        "Moonlight Greatsword",
+        "Moonlight Robe",
+        "Moonlight Waistcloth",
+        "Morning Star",
+        "Murakumo",
+        "Notched Whip",
+        "Obsidian Greatsword",
+        "Old Witch's Ring",
+        "Oolacile Catalyst",
+        "Oolacile Ivory Catalyst",
+        "Orange Charred Ring",
+        "Ornstein's Armor",
+        "Ornstein's Gauntlets",
+        "Ornstein's Helm",
+        "Ornstein's Leggings",
+        "Painting Guardian Gloves",
+        "Painting Guardian Hood",
+        "Painting Guardian Robe",
+        "Painting Guardian Sword",
+        "Painting Guardian Waistcloth",
+        "Paladin Armor",
+        "Paladin Gauntlets",
+        "Paladin Helm",
+        "Paladin Leggings",
+        "Parrying Dagger",
+        "Partizan",
+        "Pharis's Hat",
+        "Pickaxe",
+        "Pierce Shield",
+        "Pike",
+        "Plank Shield",
+        "Poison Arrow",
+        "Poisonbite Ring",
+        "Porcelain Mask",
+        "Priest's Hat",
+        "Priscilla's Dagger",
+        "Pyromancy Flame",
+        "Pyromancy Flame (Ascended)",
+        "Pyromancy: Acid Surge",
+        "Pyromancy: Black Flame",
+        "Pyromancy: Chaos Fire Whip",
+        "Pyromancy: Chaos Storm",
+        "Pyromancy: Combustion",
+        "Pyromancy: Fire Orb",
+        "Pyromancy: Fire Surge",
+        "Pyromancy: Fire Tempest",
+        "Pyromancy: Fire Whip",
+        "Pyromancy: Fireball",
+        "Pyromancy: Firestorm",
+        "Pyromancy: Flash Sweat",
+        "Pyromancy: Great Chaos Fireball",
+        "Pyromancy: Great Combustion",
+        "Pyromancy: Great Fireball",
+        "Pyromancy: Iron Flesh",
+        "Pyromancy: Poison Mist",
+        "Pyromancy: Power Within",
+        "Pyromancy: Toxic Mist",
+        "Pyromancy: Undead Rapport",
+        "Quelaag's Furysword",
+        "Rapier",
+        "Rare Ring of Sacrifice",
+        "Red Tearstone Ring",
+        "Red and White Round Shield",
+        "Reinforced Club",
+        "Ricard's Rapier",
+        "Ring of Favor and Protection",
+        "Ring of Fog",
+        "Ring of Sacrifice",
+        "Ring of Steel Protection",
+        "Ring of the Evil Eye",
+        "Ring of the Sun Princess",
+        "Ring of the Sun's Firstborn",
+        "Robe of the Channelers",
+        "Robe of the Great Lord",
+        "Royal Helm",
+        "Rusted Iron Ring",
+        "Sack",
+        "Sage Robe",
+        "Sanctus",
+        "Scimitar",
+        "Scythe",
+        "Server",
+        "Shadow Garb",
+        "Shadow Gauntlets",
+        "Shadow Leggings",
+        "Shadow Mask",
+        "Short Bow",
+        "Shortsword",
+        "Shotel",
+        "Silver Knight Armor",
+        "Silver Knight Gauntlets",
+        "Silver Knight Helm",
+        "Silver Knight Leggings",
+        "Silver Knight Shield",
+        "Silver Knight Spear",
+        "Silver Knight Straight Sword",
+        "Six-Eyed Helm of the Channelers",
+        "Skull Lantern",
+        "Slumbering Dragoncrest Ring",
+        "Small Leather Shield",
+        "Smough's Armor",
+        "Smough's Gauntlets",
+        "Smough's Hammer",
+        "Smough's Helm",
+        "Smough's Leggings",
+        "Snickering Top Hat",
+        "Sniper Bolt",
+        "Sniper Crossbow",
+        "Sorcerer Boots",
+        "Sorcerer Cloak",
+        "Sorcerer Gauntlets",
+        "Sorcerer Hat",
+        "Sorcerer's Catalyst",
+        "Sorcery: Aural Decoy",
+        "Sorcery: Cast Light",
+        "Sorcery: Chameleon",
+        "Sorcery: Crystal Magic Weapon",
+        "Sorcery: Crystal Soul Spear",
+        "Sorcery: Dark Bead",
+        "Sorcery: Dark Fog",
+        "Sorcery: Dark Orb",
+        "Sorcery: Fall Control",
+        "Sorcery: Great Heavy Soul Arrow",
+        "Sorcery: Great Magic Weapon",
+        "Sorcery: Great Soul Arrow",
+        "Sorcery: Heavy Soul Arrow",
+        "Sorcery: Hidden Body",
+        "Sorcery: Hidden Weapon",
+        "Sorcery: Homing Crystal Soulmass",
+        "Sorcery: Homing Soulmass",
+        "Sorcery: Hush",
+        "Sorcery: Magic Shield",
+        "Sorcery: Magic Weapon",
+        "Sorcery: Pursuers",
+        "Sorcery: Remedy",
+        "Sorcery: Repair",
+        "Sorcery: Resist Curse",
+        "Sorcery: Soul Arrow",
+        "Sorcery: Soul Spear",
+        "Sorcery: Strong Magic Shield",
+        "Sorcery: White Dragon Breath",
+        "Spear",
+        "Speckled Stoneplate Ring",
+        "Spell Stoneplate Ring",
+        "Spider Shield",
+        "Spiked Shield",
+        "Standard Arrow",
+        "Standard Bolt",
+        "Standard Helm",
+        "Steel Armor",
+        "Steel Gauntlets",
+        "Steel Helm",
+        "Steel Leggings",
+        "Stone Armor",
+        "Stone Gauntlets",
+        "Stone Greataxe",
+        "Stone Greatshield",
+        "Stone Greatsword",
+        "Stone Helm",
+        "Stone Leggings",
+        "Straight Sword Hilt",
+        "Sunlight Maggot",
+        "Sunlight Shield",
+        "Sunlight Straight Sword",
+        "Sunlight Talisman",
+        "Symbol of Avarice",
+        "Talisman",
+        "Target Shield",
+        "Tattered Cloth Hood",
+        "Tattered Cloth Machette",
+        "Tattered Cloth Robe",
+        "Thief Mask",
+        "Thorolund Talisman",
+        "Thunder Stoneplate Ring",
+        "Tin Banishment Catalyst",
+        "Tin Crystallization Catalyst",
+        "Tin Darkmoon Catalyst",
+        "Tiny Being's Ring",
+        "Titanite Catch Pole",
+        "Tower Kite Shield",
+        "Tower Shield",
+        "Traveling Boots",
+        "Traveling Gloves",
+        "Uchigatana",
+        "Velka's Rapier",
+        "Velka's Talisman",
+        "Waistcloth of the Channelers",
+        "Wanderer Boots",
+        "Wanderer Coat",
+        "Wanderer Hood",
+        "Wanderer Manchette",
+        "Warpick",
+        "Warrior's Round Shield",
+        "Washing Pole",
+        "Whip",
+        "White Seance Ring",
+        "Winged Spear",
+        "Witch Cloak",
+        "Witch Gloves",
+        "Witch Hat",
+        "Witch Skirt",
+        "Wolf Ring",
+        "Wood Bolt",
+        "Wooden Arrow",
+        "Wooden Shield",
+        "Xanthous Crown",
+        "Xanthous Gloves",
+        "Xanthous Overcoat",
+        "Xanthous Waistcloth",
+        "Zweihander",
+    },
+}
@@ -0,0 +1,158 @@
+"""
+Generation benchmark for the DSR world.
+
+Runs the per-world generation steps for multiworlds made of 1 to N DSR players against the stand-ins in stubs.py,
+so no Archipelago checkout is needed, and prints wall time, tracemalloc allocations and peak RSS as JSON.
+
+    python apworld/dsr/benchmark/generation.py --players 1 10 50 100 --output bench.json
+
+Every player count runs in its own process so peak RSS is not shared between runs. Items are placed into the free
+locations in random order (ignoring logic) between set_rules and fill_slot_data; the fill itself is Archipelago's and
+is not measured here.
+"""
+import argparse
+import concurrent.futures
+import dataclasses
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import stubs
+
+WORLD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STAGES = ["generate_early", "create_regions", "create_items", "set_rules", "place_items", "sweep", "fill_slot_data"]
+
+
+def load_world():
+    stubs.install()
+    spec = importlib.util.spec_from_file_location("worlds.dsr", os.path.join(WORLD_DIR, "__init__.py"),
+                                                  submodule_search_locations=[WORLD_DIR])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["worlds.dsr"] = module
+    spec.loader.exec_module(module)
+    return module.DSRWorld
+
+
+def create_multiworld(world_type, players: int, seed: int):
+    multiworld = stubs.MultiWorld(players)
+    multiworld.set_seed(seed)
+    for player in multiworld.player_ids:
+        multiworld.game[player] = world_type.game
+        world = world_type(multiworld, player)
+        world.options = world_type.options_dataclass(**{
+            field.name: field.type.from_any(field.type.default)
+            for field in dataclasses.fields(world_type.options_dataclass)
+        })
+        multiworld.worlds[player] = world
+    return multiworld
+
+
+def stage_functions(multiworld) -> Dict[str, Callable[[], object]]:
+    def call_all(method: str, stages: bool = True):
+        # Like AutoWorld.call_all: every world's method, then each world type's stage_ classmethod if it has one
+        def call():
+            for world in multiworld.worlds.values():
+                getattr(world, method)()
+            for world_type in {type(world) for world in multiworld.worlds.values()} if stages else ():
+                stage = getattr(world_type, f"stage_{method}", None)
+                if stage is not None:
+                    stage(multiworld)
+        return call
+
+    def place_items():
+        locations = multiworld.get_unfilled_locations()
+        multiworld.random.shuffle(locations)
+        for location, item in zip(locations, multiworld.itempool):
+            location.item = item
+            item.location = location
+
+    def sweep():
+        return multiworld.get_all_state()
+
+    functions = {stage: call_all(stage) for stage in STAGES}
+    functions["place_items"] = place_items
+    functions["sweep"] = sweep
+    # Main.py calls fill_slot_data on each world directly, there is no stage call for it
+    functions["fill_slot_data"] = call_all("fill_slot_data", stages=False)
+    return functions
+
+
+def run_stages(world_type, players: int, seed: int, trace: bool) -> Dict[str, Dict[str, float]]:
+    multiworld = create_multiworld(world_type, players, seed)
+    results = {}
+    for stage, function in stage_functions(multiworld).items():
+        if trace:
+            tracemalloc.start()
+            function()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results[stage] = {"allocated_bytes": current, "peak_allocated_bytes": peak}
+        else:
+            start = time.perf_counter()
+            function()
+            results[stage] = {"wall_time": time.perf_counter() - start}
+    return results
+
+
+def peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def benchmark(players: int, seed: int = 0) -> Dict[str, object]:
+    start = time.perf_counter()
+    world_type = load_world()
+    import_time = time.perf_counter() - start
+
+    # Timed and traced separately, tracemalloc slows everything down too much to trust the wall times
+    timings = run_stages(world_type, players, seed, False)
+    allocations = run_stages(world_type, players, seed, True)
+    stages = {stage: {**timings[stage], **allocations[stage]} for stage in STAGES}
+    return {
+        "players": players,
+        "import_time": import_time,
+        "total_wall_time": sum(stage["wall_time"] for stage in stages.values()),
+        "per_slot_wall_time": {stage: values["wall_time"] / players for stage, values in stages.items()},
+        "stages": stages,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 10, 50, 100],
+                        help="DSR player counts to benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for players in args.players:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.append(executor.submit(benchmark, players, args.seed).result())
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Import-time benchmark for the DSR world.
+
+Measures, in fresh interpreters, how long importing the world takes and how long the first access to the lazily built
+item and location tables takes afterwards. Prints the medians as JSON.
+
+    python apworld/dsr/benchmark/imports.py --runs 20
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from generation import load_world
+
+
+def measure_once():
+    start = time.perf_counter()
+    world_type = load_world()
+    imported = time.perf_counter()
+    items = sys.modules["worlds.dsr.Items"]
+    locations = sys.modules["worlds.dsr.Locations"]
+    items.item_dictionary, locations.location_tables
+    tables = time.perf_counter()
+    return {"import_time": imported - start, "table_build_time": tables - imported,
+            "item_name_to_id": len(world_type.item_name_to_id)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--once", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.once:
+        print(json.dumps(measure_once()))
+        return
+
+    runs = []
+    # The first run compiles and caches the bytecode, it is not counted
+    for _ in range(args.runs + 1):
+        output = subprocess.run([sys.executable, __file__, "--once"], check=True, capture_output=True, text=True)
+        runs.append(json.loads(output.stdout))
+    runs = runs[1:]
+    print(json.dumps({
+        "runs": args.runs,
+        "import_time": statistics.median(run["import_time"] for run in runs),
+        "table_build_time": statistics.median(run["table_build_time"] for run in runs),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Memory benchmark for the DSR world.
+
+Builds the regions, locations and items of multiworlds made of N DSR players against the stand-ins in stubs.py and
+prints, as JSON, the bytes each slot keeps alive and the size of a single location and item instance.
+
+    python apworld/dsr/benchmark/memory.py --players 1 10 50
+
+The shared item and location tables are built before tracing starts, they are paid once per process, not per slot.
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Dict, List
+
+from generation import create_multiworld, load_world
+
+
+def instance_size(instance) -> int:
+    # The object itself plus its attribute dict, if it has one
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def measure(players: int, seed: int = 0) -> Dict[str, object]:
+    world_type = load_world()
+    items = sys.modules["worlds.dsr.Items"]
+    locations = sys.modules["worlds.dsr.Locations"]
+    items.item_dictionary, items.progression_item_bits, locations.location_tables
+
+    gc.collect()
+    tracemalloc.start()
+    multiworld = create_multiworld(world_type, players, seed)
+    for stage in ["generate_early", "create_regions", "create_items"]:
+        for world in multiworld.worlds.values():
+            getattr(world, stage)()
+        # Then the stage_ classmethod, as AutoWorld.call_all does; the items are only created there
+        stage_method = getattr(world_type, f"stage_{stage}", None)
+        if stage_method is not None:
+            stage_method(multiworld)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    slot_locations = multiworld.get_locations(1)
+    return {
+        "players": players,
+        "bytes_per_slot": retained / players,
+        "locations_per_slot": len(slot_locations),
+        "bytes_per_location_instance": instance_size(slot_locations[0]),
+        "bytes_per_item_instance": instance_size(multiworld.itempool[0]),
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    print(json.dumps([measure(players, args.seed) for players in args.players], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+Minimal stand-ins for the parts of Archipelago the DSR world touches during generation.
+
+They only exist so the generation benchmark can run without an Archipelago checkout. They implement the same
+methods and attributes as the real classes, with the same lookup costs where it matters (dict-backed location and
+entrance caches, per-player item counters), but none of the real fill, balancing or spoiler logic.
+"""
+import dataclasses
+import enum
+import random
+import sys
+import types
+from collections import Counter
+from typing import Dict, List, Optional
+
+
+# BaseClasses
+
+class ItemClassification(enum.IntFlag):
+    filler = 0b0000
+    progression = 0b0001
+    useful = 0b0010
+    trap = 0b0100
+    skip_balancing = 0b1000
+    progression_skip_balancing = 0b1001
+
+
+class Item:
+    game: str = "Generic"
+    # Same slots as the real Item
+    __slots__ = ("name", "classification", "code", "player", "location")
+
+    def __init__(self, name: str, classification: ItemClassification, code: Optional[int], player: int):
+        self.name = name
+        self.classification = classification
+        self.code = code
+        self.player = player
+        self.location = None
+
+    @property
+    def advancement(self) -> bool:
+        return ItemClassification.progression in self.classification
+
+
+class Location:
+    game: str = "Generic"
+    item: Optional[Item] = None
+    locked: bool = False
+    show_in_spoiler: bool = True
+    progress_type: int = 0
+
+    def __init__(self, player: int, name: str = "", address: Optional[int] = None, parent=None):
+        self.player = player
+        self.name = name
+        self.address = address
+        self.parent_region = parent
+
+    @staticmethod
+    def access_rule(state) -> bool:
+        return True
+
+    @staticmethod
+    def item_rule(item) -> bool:
+        return True
+
+    def can_reach(self, state) -> bool:
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def place_locked_item(self, item: Item):
+        self.item = item
+        self.locked = True
+        item.location = self
+
+
+class Entrance:
+    def __init__(self, player: int, name: str = "", parent=None):
+        self.player = player
+        self.name = name
+        self.parent_region = parent
+        self.connected_region = None
+
+    @staticmethod
+    def access_rule(state) -> bool:
+        return True
+
+    def can_reach(self, state) -> bool:
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def connect(self, region, addresses=None, target=None):
+        self.connected_region = region
+        self.target = target
+        self.addresses = addresses
+        region.entrances.append(self)
+
+
+class Region:
+    def __init__(self, name: str, player: int, multiworld, hint: Optional[str] = None):
+        self.name = name
+        self.player = player
+        self.multiworld = multiworld
+        self.locations: List[Location] = []
+        self.exits: List[Entrance] = []
+        self.entrances: List[Entrance] = []
+
+    def can_reach(self, state) -> bool:
+        state.update_reachable_regions(self.player)
+        return self in state.reachable_regions[self.player]
+
+
+class Tutorial:
+    def __init__(self, *args):
+        self.args = args
+
+
+class CollectionState:
+    def __init__(self, multiworld):
+        self.multiworld = multiworld
+        self.prog_items: Dict[int, Counter] = {player: Counter() for player in multiworld.player_ids}
+        self.reachable_regions = {player: set() for player in multiworld.player_ids}
+        self.stale = {player: True for player in multiworld.player_ids}
+        self.locations_checked = set()
+        for items in multiworld.precollected_items.values():
+            for item in items:
+                self.collect(item, True)
+
+    def has(self, item: str, player: int, count: int = 1) -> bool:
+        return self.prog_items[player][item] >= count
+
+    def has_all(self, items, player: int) -> bool:
+        return all(self.prog_items[player][item] for item in items)
+
+    def has_any(self, items, player: int) -> bool:
+        return any(self.prog_items[player][item] for item in items)
+
+    def count(self, item: str, player: int) -> int:
+        return self.prog_items[player][item]
+
+    def collect(self, item: Item, event: bool = False, location: Optional[Location] = None) -> bool:
+        if location:
+            self.locations_checked.add(location)
+        changed = self.multiworld.worlds[item.player].collect(self, item)
+        self.stale[item.player] = True
+        return changed
+
+    def remove(self, item: Item) -> bool:
+        changed = self.multiworld.worlds[item.player].remove(self, item)
+        self.stale[item.player] = True
+        return changed
+
+    def can_reach(self, spot, resolution_hint: Optional[str] = None, player: Optional[int] = None) -> bool:
+        if isinstance(spot, str):
+            if resolution_hint == "Location":
+                spot = self.multiworld.get_location(spot, player)
+            elif resolution_hint == "Entrance":
+                spot = self.multiworld.get_entrance(spot, player)
+            else:
+                spot = self.multiworld.get_region(spot, player)
+        return spot.can_reach(self)
+
+    def update_reachable_regions(self, player: int):
+        if not self.stale[player]:
+            return
+        self.stale[player] = False
+        start = self.multiworld.get_region("Menu", player)
+        reachable = {start}
+        queue = [start]
+        while queue:
+            region = queue.pop()
+            for exit_ in region.exits:
+                if exit_.connected_region not in reachable and exit_.access_rule(self):
+                    reachable.add(exit_.connected_region)
+                    queue.append(exit_.connected_region)
+        self.reachable_regions[player] = reachable
+
+    def sweep_for_events(self, locations=None):
+        if locations is None:
+            locations = self.multiworld.get_filled_locations()
+        pending = [location for location in locations if location.item.advancement and location not in self.locations_checked]
+        while pending:
+            reachable = [location for location in pending if location.can_reach(self)]
+            if not reachable:
+                break
+            for location in reachable:
+                self.collect(location.item, True, location)
+            pending = [location for location in pending if location not in self.locations_checked]
+
+
+class _RegionList(list):
+    # Stands in for the real RegionManager: keeps a per-player view so player-filtered queries do not scan everything
+    def __init__(self, player_ids):
+        super().__init__()
+        self.by_player: Dict[int, List[Region]] = {player: [] for player in player_ids}
+
+    def append(self, region: Region):
+        super().append(region)
+        self.by_player[region.player].append(region)
+
+
+class MultiWorld:
+    def __init__(self, players: int):
+        self.players = players
+        self.player_ids = tuple(range(1, players + 1))
+        self.game: Dict[int, str] = {}
+        self.player_name: Dict[int, str] = {player: f"Player{player}" for player in self.player_ids}
+        self.worlds: Dict[int, object] = {}
+        self.regions = _RegionList(self.player_ids)
+        self.itempool: List[Item] = []
+        self.precollected_items: Dict[int, List[Item]] = {player: [] for player in self.player_ids}
+        self.completion_condition: Dict[int, object] = {}
+        self.seed = 0
+        self.seed_name = "benchmark"
+        self.random = random.Random(self.seed)
+        self._refresh_caches()
+
+    def _refresh_caches(self):
+        # The real MultiWorld keeps these caches up to date as regions are added, here they are rebuilt on a miss
+        self._region_cache: Dict[int, Dict[str, Region]] = {player: {} for player in self.player_ids}
+        self._location_cache: Dict[int, Dict[str, Location]] = {player: {} for player in self.player_ids}
+        self._entrance_cache: Dict[int, Dict[str, Entrance]] = {player: {} for player in self.player_ids}
+        for region in self.regions:
+            self._region_cache[region.player][region.name] = region
+            for location in region.locations:
+                self._location_cache[region.player][location.name] = location
+            for exit_ in region.exits:
+                self._entrance_cache[region.player][exit_.name] = exit_
+
+    def _cached(self, cache_name: str, name: str, player: int):
+        if name not in getattr(self, cache_name)[player]:
+            self._refresh_caches()
+        return getattr(self, cache_name)[player][name]
+
+    def push_precollected(self, item: Item):
+        self.precollected_items[item.player].append(item)
+
+    def set_seed(self, seed: int):
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    def get_game_players(self, game_name: str):
+        return tuple(player for player in self.player_ids if self.game[player] == game_name)
+
+    def get_regions(self, player: Optional[int] = None):
+        return self.regions if player is None else self.regions.by_player[player]
+
+    def get_region(self, region_name: str, player: int) -> Region:
+        return self._cached("_region_cache", region_name, player)
+
+    def get_entrance(self, entrance_name: str, player: int) -> Entrance:
+        return self._cached("_entrance_cache", entrance_name, player)
+
+    def get_location(self, location_name: str, player: int) -> Location:
+        return self._cached("_location_cache", location_name, player)
+
+    def get_locations(self, player: Optional[int] = None) -> List[Location]:
+        return [location for region in self.get_regions(player) for location in region.locations]
+
+    def get_filled_locations(self, player: Optional[int] = None) -> List[Location]:
+        return [location for location in self.get_locations(player) if location.item is not None]
+
+    def get_unfilled_locations(self, player: Optional[int] = None) -> List[Location]:
+        return [location for location in self.get_locations(player) if location.item is None]
+
+    def get_all_state(self, use_cache: bool = False) -> CollectionState:
+        state = CollectionState(self)
+        for item in self.itempool:
+            self.worlds[item.player].collect(state, item)
+        state.sweep_for_events()
+        return state
+
+
+# Options
+
+class Option:
+    default = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def from_any(cls, data):
+        return cls(data)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+
+class Toggle(Option):
+    default = 0
+
+
+class DefaultOnToggle(Toggle):
+    default = 1
+
+
+class Range(Option):
+    range_start = 0
+    range_end = 1
+
+
+class Choice(Option):
+    pass
+
+
+class OptionDict(Option):
+    default: Dict = {}
+
+    def __init__(self, value):
+        self.value = dict(value)
+
+
+class ItemDict(OptionDict):
+    pass
+
+
+class OptionSet(Option):
+    default = frozenset()
+
+    def __init__(self, value):
+        self.value = set(value)
+
+
+class OptionError(ValueError):
+    pass
+
+
+class DeathLink(Toggle):
+    pass
+
+
+@dataclasses.dataclass
+class PerGameCommonOptions:
+    pass
+
+
+# worlds.AutoWorld
+
+class WebWorld:
+    pass
+
+
+class World:
+    item_name_groups: Dict = {}
+
+    def __init__(self, multiworld: MultiWorld, player: int):
+        self.multiworld = multiworld
+        self.player = player
+        self.random = random.Random(multiworld.random.getrandbits(64))
+
+    def collect_item(self, state: CollectionState, item: Item, remove: bool = False) -> Optional[str]:
+        return item.name if item.advancement else None
+
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        name = self.collect_item(state, item)
+        if name:
+            state.prog_items[item.player][name] += 1
+            return True
+        return False
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        name = self.collect_item(state, item, True)
+        if name:
+            state.prog_items[item.player][name] -= 1
+            if state.prog_items[item.player][name] < 1:
+                del state.prog_items[item.player][name]
+            return True
+        return False
+
+
+# worlds.generic.Rules
+
+def set_rule(spot, rule):
+    spot.access_rule = rule
+
+
+def add_rule(spot, rule, combine: str = "and"):
+    old_rule = spot.access_rule
+    if combine == "or":
+        spot.access_rule = lambda state: rule(state) or old_rule(state)
+    else:
+        spot.access_rule = lambda state: rule(state) and old_rule(state)
+
+
+def add_item_rule(location, rule, combine: str = "and"):
+    old_rule = location.item_rule
+    if combine == "or":
+        location.item_rule = lambda item: rule(item) or old_rule(item)
+    else:
+        location.item_rule = lambda item: rule(item) and old_rule(item)
+
+
+def install():
+    """Registers the stand-ins as BaseClasses, Options, worlds.AutoWorld and worlds.generic.Rules."""
+    this = sys.modules[__name__]
+    modules = {
+        "BaseClasses": ["ItemClassification", "Item", "Location", "Entrance", "Region", "Tutorial", "CollectionState",
+                        "MultiWorld"],
+        "Options": ["Option", "Toggle", "DefaultOnToggle", "Range", "Choice", "OptionDict", "ItemDict", "OptionSet",
+                    "DeathLink", "PerGameCommonOptions", "OptionError"],
+        "worlds.AutoWorld": ["WebWorld", "World"],
+        "worlds.generic.Rules": ["set_rule", "add_rule", "add_item_rule"],
+    }
+    for package in ["worlds", "worlds.generic"]:
+        module = types.ModuleType(package)
+        module.__path__ = []
+        sys.modules[package] = module
+    for module_name, names in modules.items():
+        module = types.ModuleType(module_name)
+        for name in names:
+            setattr(module, name, getattr(this, name))
+        sys.modules[module_name] = module
+    sys.modules["worlds"].AutoWorld = sys.modules["worlds.AutoWorld"]
+    sys.modules["worlds"].generic = sys.modules["worlds.generic"]
+    sys.modules["worlds.generic"].Rules = sys.modules["worlds.generic.Rules"]
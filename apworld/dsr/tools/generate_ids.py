@@ -0,0 +1,197 @@
+"""
+Generates the files the world loads instead of its source tables:
+_ids.py, the literal item/location id tables and item groups the world registers with at import, and _tables.bin, the
+rows of ItemTable.py and LocationTable.py pre-parsed into a marshal cache (see Definitions.load_table_cache).
+
+    python apworld/dsr/tools/generate_ids.py          # rewrite _ids.py and _tables.bin from ItemTable.py and LocationTable.py
+    python apworld/dsr/tools/generate_ids.py --check  # fail if either is out of date with the tables
+
+The table consistency checks (duplicate names and ids, location tables over the per-region id budget, tables missing
+from the region order) run here instead of on every import. When the client's source/Resources JSON files are next to
+the apworld, item ids and location ids are also checked against them so the client and the apworld cannot drift.
+"""
+import argparse
+import importlib
+import json
+import marshal
+import os
+import re
+import sys
+import types
+from collections import Counter
+from typing import Dict, List
+
+WORLD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IDS_PATH = os.path.join(WORLD_DIR, "_ids.py")
+RESOURCES_DIR = os.path.join(WORLD_DIR, "..", "..", "source", "Resources")
+
+BASE_ID = 11110000
+TABLE_OFFSET = 1000
+
+# Location categories the client has to be able to detect, by id, from ItemLots.json, Doors.json or Bonfires.json
+CLIENT_LOCATION_CATEGORIES = {"ITEM_LOT", "SNUGGLY_TRADE", "DOOR", "BONFIRE", "ENEMY_DROP"}
+CLIENT_LOCATION_FILES = ["ItemLots.json", "Doors.json", "Bonfires.json"]
+# Known gaps in the client data, each one is an item the client cannot give or a location it cannot report yet
+CLIENT_ITEM_GAPS = {
+    11113034,  # Estus Flask
+    11117215, 11117216, 11117217, 11117218,  # Elite Cleric set
+    11120000,  # Lag Trap
+}
+CLIENT_LOCATION_GAPS = {
+    11110371,  # DA: Large Soul of a Brave Warrior - In Reah's Cell
+}
+
+
+def load_world_modules():
+    try:
+        import BaseClasses
+    except ImportError:
+        # No Archipelago checkout, use the benchmark stand-ins
+        sys.path.insert(0, os.path.join(WORLD_DIR, "benchmark"))
+        import stubs
+        stubs.install()
+    # Only the table modules are loaded, the world itself imports the _ids.py being generated
+    package = types.ModuleType("worlds.dsr")
+    package.__path__ = [WORLD_DIR]
+    sys.modules["worlds.dsr"] = package
+    return (importlib.import_module("worlds.dsr.Items"), importlib.import_module("worlds.dsr.Locations"),
+            importlib.import_module("worlds.dsr.ItemTable"), importlib.import_module("worlds.dsr.LocationTable"),
+            importlib.import_module("worlds.dsr.Definitions"))
+
+
+def check_unique(kind: str, values: List, errors: List[str]):
+    for value, count in Counter(values).items():
+        if count > 1:
+            errors.append(f"Duplicate {kind} {value!r} ({count} entries)")
+
+
+def build_item_name_to_id(all_items, errors: List[str]) -> Dict[str, int]:
+    check_unique("item name", [item.name for item in all_items], errors)
+    check_unique("item dsr_code", [item.dsr_code for item in all_items], errors)
+    return {item.name: (BASE_ID + item.dsr_code if item.dsr_code is not None else None) for item in all_items}
+
+
+def build_location_name_to_id(order, tables, errors: List[str]) -> Dict[str, int]:
+    for region_name in set(tables) - set(order):
+        errors.append(f"Location table {region_name!r} is missing from location_table_order")
+    for region_name in set(order) - set(tables):
+        errors.append(f"location_table_order lists {region_name!r}, which has no location table")
+
+    output = {}
+    for i, region_name in enumerate(order):
+        table = tables.get(region_name, [])
+        if len(table) > TABLE_OFFSET:
+            errors.append(f"A location table has {len(table)} entries, that is more than {TABLE_OFFSET} entries (table #{i})")
+        output.update({location_data.name: location_data.id for location_data in table})
+
+    all_locations = [location_data for table in tables.values() for location_data in table]
+    check_unique("location name", [location_data.name for location_data in all_locations], errors)
+    check_unique("location id", [location_data.id for location_data in all_locations], errors)
+    return output
+
+
+def load_client_resource(file_name: str) -> List[dict]:
+    with open(os.path.join(RESOURCES_DIR, file_name), encoding="utf-8-sig") as resource_file:
+        # A few of the client files carry // comments
+        return json.loads(re.sub(r"^\s*//.*$", "", resource_file.read(), flags=re.MULTILINE))
+
+
+def check_client_resources(all_items, tables, errors: List[str]):
+    # The client matches items by ApId and locations by Id, names only differ in spelling here and there
+    client_item_ids: Dict[str, set] = {}
+    for file_name in sorted(os.listdir(RESOURCES_DIR)):
+        if file_name.endswith(".json"):
+            for entry in load_client_resource(file_name):
+                if "ApId" in entry:
+                    client_item_ids.setdefault(entry["Name"], set()).add(entry["ApId"])
+    all_client_item_ids = set().union(*client_item_ids.values())
+    for item in all_items:
+        item_id = BASE_ID + item.dsr_code
+        if item.name in client_item_ids and item_id not in client_item_ids[item.name]:
+            errors.append(f"Item {item.name!r} has id {item_id} in the apworld but {sorted(client_item_ids[item.name])} in the client")
+        elif item.category.name != "EVENT" and item_id not in all_client_item_ids and item_id not in CLIENT_ITEM_GAPS:
+            errors.append(f"Item {item.name!r} ({item_id}) is missing from the client's item files")
+
+    client_location_ids = {entry["Id"] for file_name in CLIENT_LOCATION_FILES for entry in load_client_resource(file_name)}
+    for table in tables.values():
+        for location_data in table:
+            if (location_data.category.name in CLIENT_LOCATION_CATEGORIES and location_data.id not in client_location_ids
+                    and location_data.id not in CLIENT_LOCATION_GAPS):
+                errors.append(f"Location {location_data.name!r} ({location_data.id}) is missing from the client's {', '.join(CLIENT_LOCATION_FILES)}")
+
+
+def render_table_cache(Definitions, all_items, tables) -> bytes:
+    items = tuple((item.name, item.dsr_code, int(item.category)) for item in all_items)
+    locations = tuple(
+        (region_name, tuple((location_data.id, location_data.name, location_data.default_item, int(location_data.category)) for location_data in table))
+        for region_name, table in tables.items()
+    )
+    # Version 2 has no object references, so the output only depends on the tables and --check can compare bytes
+    return marshal.dumps((Definitions.TABLE_CACHE_FORMAT, items, locations), 2)
+
+
+def render(item_name_to_id: Dict[str, int], location_name_to_id: Dict[str, int], item_name_groups: Dict[str, set]) -> str:
+    quote = json.dumps
+    lines = [
+        "# Generated from the tables in ItemTable.py and LocationTable.py, do not edit by hand.",
+        "# Lets the world register its ids and item groups without building the full tables at import.",
+        "",
+        "item_name_to_id = {",
+    ]
+    lines += [f"    {quote(name)}: {quote(code)}," for name, code in item_name_to_id.items()]
+    lines += ["}", "", "location_name_to_id = {"]
+    lines += [f"    {quote(name)}: {quote(code)}," for name, code in location_name_to_id.items()]
+    lines += ["}", "", "item_name_groups = {"]
+    for group, names in item_name_groups.items():
+        lines.append(f"    {quote(group)}: {{")
+        lines += [f"        {quote(name)}," for name in sorted(names)]
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="Only verify that _ids.py is up to date")
+    args = parser.parse_args(argv)
+
+    Items, Locations, ItemTable, LocationTable, Definitions = load_world_modules()
+    # Always from the source tables, never from the cache being generated
+    all_items = ItemTable.build_all_items()
+    tables = LocationTable.build_location_tables()
+    errors: List[str] = []
+    item_name_to_id = build_item_name_to_id(all_items, errors)
+    location_name_to_id = build_location_name_to_id(Locations.location_table_order, tables, errors)
+    item_name_groups = Items.build_item_name_groups(Items._build_item_pool_buckets(all_items))
+    if os.path.isdir(RESOURCES_DIR):
+        check_client_resources(all_items, tables, errors)
+    else:
+        print(f"{RESOURCES_DIR} not found, skipping the client id checks", file=sys.stderr)
+    if errors:
+        print("\n".join(errors), file=sys.stderr)
+        return 1
+
+    outputs = {
+        IDS_PATH: render(item_name_to_id, location_name_to_id, item_name_groups).encode("utf-8"),
+        os.path.join(WORLD_DIR, Definitions.TABLE_CACHE_NAME): render_table_cache(Definitions, all_items, tables),
+    }
+    stale = []
+    for path, content in outputs.items():
+        current = None
+        if os.path.exists(path):
+            with open(path, "rb") as output_file:
+                current = output_file.read()
+        if current != content:
+            stale.append(path)
+            if not args.check:
+                with open(path, "wb") as output_file:
+                    output_file.write(content)
+    if args.check and stale:
+        names = ", ".join(os.path.basename(path) for path in stale)
+        print(f"Out of date with ItemTable.py/LocationTable.py: {names}, run tools/generate_ids.py", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())